@@ -1,19 +1,55 @@
 import os
+import sys
 import streamlit as st
+import numpy as np
 import pandas as pd
 import seaborn as sns
 import matplotlib.pyplot as plt
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 
 # Load the dataset
 #file_path = '/workspaces/laptopdataanalysis/app_analyis/df.csv'
 #df = pd.read_csv(file_path)
 
-# Load the dataset using a relative path
-file_path = os.path.join(os.path.dirname(__file__), 'df.csv')
-df = pd.read_csv(file_path)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
+from src.data import price_history, shared_dataset
+from src.features import moments
+from src.visualization import visualize as charts
+
+
+@st.cache_resource(max_entries=1)
+def load_shared_dataset(version):
+    # One mapping per server process, shared by every session; max_entries=1
+    # drops the previous version once a new one has been published.
+    return shared_dataset.read_dataframe(version=version)
+
+
+def using_shared_dataset():
+    # Falls back to df.csv until something has been published to the store.
+    return bool(os.environ.get(shared_dataset.STORE_ENV_VAR)) \
+        and shared_dataset.current_version() is not None
+
+
+@st.cache_resource(max_entries=1)
+def load_csv_dataset(file_path, mtime, size):
+    # Keyed on the file's mtime and size, so df.csv is read and hashed once
+    # per change rather than on every rerun.
+    frame = pd.read_csv(file_path)
+    return frame, shared_dataset.dataset_version(frame)
+
+
+def load_dataset():
+    # When LAPTOP_DATASET_STORE is set, attach to the dataset published there
+    # instead of giving every process its own copy of df.csv.
+    if using_shared_dataset():
+        version = shared_dataset.current_version()
+        return load_shared_dataset(version), version
+    # Load the dataset using a relative path
+    file_path = os.path.join(os.path.dirname(__file__), 'df.csv')
+    stat = os.stat(file_path)
+    return load_csv_dataset(file_path, stat.st_mtime_ns, stat.st_size)
+
+
+df, df_version = load_dataset()
 
 # Streamlit App
 def main():
@@ -25,6 +61,10 @@ def main():
         initial_sidebar_state="expanded",
     )
 
+    if os.environ.get(shared_dataset.STORE_ENV_VAR) and not using_shared_dataset():
+        st.warning("Nothing has been published to the shared dataset store yet; "
+                   "showing the bundled df.csv instead.")
+
     # Sidebar for navigation
     st.sidebar.title("Navigation")
     pages = {
@@ -35,6 +75,8 @@ def main():
         "Performance Analysis": performance_analysis,
         "Display and Design Analysis": display_design_analysis,
         "Additional Insights": additional_insights,
+        "Price Trends": price_trends,
+        "Correlation Analysis": correlation_analysis,
         "Conclusion and Recommendations": conclusion_recommendations,
     }
     
@@ -53,49 +95,14 @@ def home():
 
     # Plotly Chart
     st.subheader("Price Distribution by Brand")
-    fig = px.box(df, x="Brand", y="Price", title="Price Distribution by Brand",
-                 labels={"Price": "Price in Rupees", "Brand": "Laptop Brand"})
-    fig.update_layout(
-        plot_bgcolor="rgba(0, 0, 0, 0)",
-        paper_bgcolor="rgba(0, 0, 0, 0)",
-        font=dict(color="white")
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(charts.price_by_brand(df), use_container_width=True)
 
     # Top 5 Laptops by Highest Price
     st.subheader("Top 5 Laptops by Highest Price")
-    top_5_df = df[['Brand', 'Spec_Score', 'Series', 'Price']].sort_values(by='Price', ascending=False).head()
-    fig_table = go.Figure(data=[go.Table(
-        columnwidth=[80, 80, 80, 80],
-        header=dict(values=list(top_5_df.columns),
-                    fill_color='gray',
-                    font=dict(color='white', size=12),
-                    align='center'),
-        cells=dict(values=[top_5_df.Brand, top_5_df.Spec_Score, top_5_df.Series, top_5_df.Price],
-                fill_color='lightgray',
-                font=dict(color='black', size=11),
-                align='center'))
-    ])
-    fig_table.update_layout(
-        width=800,  # Adjust width as needed
-        height=200,  # Adjust height as needed
-        margin=dict(l=0, r=0, t=0, b=0),
-        paper_bgcolor="#1E1E1E",  # Background color to match the main background
-        plot_bgcolor="#1E1E1E"
-    )
-    st.plotly_chart(fig_table, use_container_width=True)
+    st.plotly_chart(charts.top_5_by_price(df), use_container_width=True)
 
     # Average Price by Brand
-    avg_price_by_brand = df.groupby('Brand')['Price'].mean().reset_index()
-    fig_avg_price = px.bar(avg_price_by_brand, x='Brand', y='Price', color='Brand',
-                        title="Average Price by Brand",
-                        labels={"Price": "Average Price in Rupees", "Brand": "Laptop Brand"})
-    fig_avg_price.update_layout(
-        plot_bgcolor="rgba(0, 0, 0, 0)",
-        paper_bgcolor="rgba(0, 0, 0, 0)",
-        font=dict(color="white")
-    )
-    st.plotly_chart(fig_avg_price, use_container_width=True)
+    st.plotly_chart(charts.average_price_by_brand(df), use_container_width=True)
 
 
 def data_overview():
@@ -107,45 +114,12 @@ def data_overview():
 
     # Brand Distribution
     st.subheader("Brand Distribution")
-    brand_counts = df['Brand'].value_counts().reset_index()
-    brand_counts.columns = ['Brand', 'Count']
-    fig_bar_brand = px.bar(brand_counts, x='Brand', y='Count', 
-                           title="Number of Laptops per Brand", 
-                           labels={"Brand": "Brand", "Count": "Count"})
-    fig_bar_brand.update_layout(
-        plot_bgcolor="rgba(0, 0, 0, 0)",
-        paper_bgcolor="rgba(0, 0, 0, 0)",
-        font=dict(color="white")
-    )
-    st.plotly_chart(fig_bar_brand, use_container_width=True)
+    st.plotly_chart(charts.brand_distribution(df), use_container_width=True)
 
     # Side-by-Side Pie Charts
 
     st.subheader("Brand Market Share")
-    top_5_brands = brand_counts.nlargest(5, 'Count')
-    Other_Brands = brand_counts.iloc[5:]
-
-    fig = make_subplots(rows=1, cols=2, specs=[[{'type': 'domain'}, {'type': 'domain'}]],
-                        subplot_titles=('Top 5 Brands', 'Other Brands'))
-
-    # Top 5 brands pie chart
-    fig.add_trace(go.Pie(labels=top_5_brands['Brand'], values=top_5_brands['Count'], name="Top 5 Brands"),
-                  row=1, col=1)
-
-    # Remaining brands pie chart
-    fig.add_trace(go.Pie(labels=Other_Brands['Brand'], values=Other_Brands['Count'], name="Other Brands"),
-                  row=1, col=2)
-
-    fig.update_layout(
-        title_text="Market Share of Laptop Brands",
-        annotations=[dict(text='Top 5 Brands', x=0.18, y=0.5, font_size=15, showarrow=False),
-                     dict(text='Other Brands', x=0.82, y=0.5, font_size=15, showarrow=False)],
-        paper_bgcolor="rgba(0, 0, 0, 0)",
-        plot_bgcolor="rgba(0, 0, 0, 0)",
-        font=dict(color="white")
-    )
-
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(charts.brand_market_share(df), use_container_width=True)
 
 
 # Brand Analysis
@@ -184,27 +158,13 @@ def brand_analysis():
 
     # Spec Score Distribution for the selected brand
     st.subheader("Spec Score Distribution")
-    fig_spec_score = px.box(brand_data, y='Spec_Score', color='Brand',
-                            title=f"Spec Score Distribution for {selected_brand}",
-                            labels={"Spec_Score": "Specification Score", "Brand": "Laptop Brand"})
-    fig_spec_score.update_layout(
-        plot_bgcolor="rgba(0, 0, 0, 0)",
-        paper_bgcolor="rgba(0, 0, 0, 0)",
-        font=dict(color="white")
-    )
-    st.plotly_chart(fig_spec_score, use_container_width=True)
+    st.plotly_chart(charts.brand_spec_score_distribution(brand_data, selected_brand),
+                    use_container_width=True)
     
     # Price vs. Spec Score for the selected brand
     st.subheader("Price vs. Spec Score")
-    fig_price_spec = px.scatter(brand_data, x='Spec_Score', y='Price', color='Series',
-                                title=f"Price vs. Spec Score for {selected_brand}",
-                                labels={"Spec_Score": "Specification Score", "Price": "Price in Rupees", "Series": "Laptop Series"})
-    fig_price_spec.update_layout(
-        plot_bgcolor="rgba(0, 0, 0, 0)",
-        paper_bgcolor="rgba(0, 0, 0, 0)",
-        font=dict(color="white")
-    )
-    st.plotly_chart(fig_price_spec, use_container_width=True)
+    st.plotly_chart(charts.brand_price_vs_spec_score(brand_data, selected_brand),
+                    use_container_width=True)
 
 # Price_Analysis
 
@@ -213,78 +173,27 @@ def price_analysis():
 
     # Price Distribution
     st.subheader("Price Distribution")
-    fig_price_dist = px.histogram(df, x='Price', nbins=30, color='Brand',
-                                  title="Distribution of Laptop Prices",
-                                  labels={"Price": "Price in USD", "Brand": "Laptop Brand"})
-    fig_price_dist.update_layout(
-        plot_bgcolor="rgba(0, 0, 0, 0)",
-        paper_bgcolor="rgba(0, 0, 0, 0)",
-        font=dict(color="white")
-    )
-    st.plotly_chart(fig_price_dist, use_container_width=True)
+    st.plotly_chart(charts.price_distribution(df), use_container_width=True)
 
     # Price vs. Spec Score
     st.subheader("Price vs. Spec Score")
-    fig_price_spec = px.scatter(df, x="Spec_Score", y="Price", color="Brand",
-                                title="Price vs. Spec Score",
-                                labels={"Spec_Score": "Specification Score", "Price": "Price in Rupees", "Brand": "Laptop Brand"})
-    fig_price_spec.update_layout(
-        plot_bgcolor="rgba(0, 0, 0, 0)",
-        paper_bgcolor="rgba(0, 0, 0, 0)",
-        font=dict(color="white")
-    )
-    st.plotly_chart(fig_price_spec, use_container_width=True)
+    st.plotly_chart(charts.price_vs_spec_score(df), use_container_width=True)
 
     # Price Range Distribution
     st.subheader("Price Range Distribution")
-    price_range_counts = df['Price_Range'].value_counts().reset_index()
-    price_range_counts.columns = ['Price_Range', 'Count']
-    fig_price_range = px.bar(price_range_counts, x='Price_Range', y='Count', 
-                             title="Number of Laptops per Price Range", 
-                             labels={"Price_Range": "Price Range", "Count": "Count"})
-    fig_price_range.update_layout(
-        plot_bgcolor="rgba(0, 0, 0, 0)",
-        paper_bgcolor="rgba(0, 0, 0, 0)",
-        font=dict(color="white")
-    )
-    st.plotly_chart(fig_price_range, use_container_width=True)
+    st.plotly_chart(charts.price_range_distribution(df), use_container_width=True)
 
     # Top 10 Most Expensive Laptops
     st.subheader("Top 10 Most Expensive Laptops")
-    top_10_expensive = df.nlargest(10, 'Price')
-    fig_top_10 = px.bar(top_10_expensive, x='Series', y='Price', color='Brand',
-                        title="Top 10 Most Expensive Laptops",
-                        labels={"Series": "Laptop Series", "Price": "Price in Rupees", "Brand": "Laptop Brand"})
-    fig_top_10.update_layout(
-        plot_bgcolor="rgba(0, 0, 0, 0)",
-        paper_bgcolor="rgba(0, 0, 0, 0)",
-        font=dict(color="white")
-    )
-    st.plotly_chart(fig_top_10, use_container_width=True)
+    st.plotly_chart(charts.top_10_expensive(df), use_container_width=True)
 
     # Price Distribution by Utility
     st.subheader("Price Distribution by Utility")
-    fig_price_utility = px.box(df, x='Utility', y='Price', color='Utility',
-                               title="Price Distribution by Utility",
-                               labels={"Utility": "Utility", "Price": "Price in Rupees"})
-    fig_price_utility.update_layout(
-        plot_bgcolor="rgba(0, 0, 0, 0)",
-        paper_bgcolor="rgba(0, 0, 0, 0)",
-        font=dict(color="white")
-    )
-    st.plotly_chart(fig_price_utility, use_container_width=True)
+    st.plotly_chart(charts.price_by_utility(df), use_container_width=True)
 
     # Price vs. RAM Capacity
     st.subheader("Price vs. RAM Capacity")
-    fig_price_ram = px.scatter(df, x='Ram_Capacity(GB)', y='Price', color='Brand',
-                               title="Price vs. RAM Capacity",
-                               labels={"Ram_Capacity(GB)": "RAM Capacity (GB)", "Price": "Price in Rupees", "Brand": "Laptop Brand"})
-    fig_price_ram.update_layout(
-        plot_bgcolor="rgba(0, 0, 0, 0)",
-        paper_bgcolor="rgba(0, 0, 0, 0)",
-        font=dict(color="white")
-    )
-    st.plotly_chart(fig_price_ram, use_container_width=True)
+    st.plotly_chart(charts.price_vs_ram(df), use_container_width=True)
 
 # Performane Analysis
 
@@ -293,40 +202,15 @@ def performance_analysis():
 
     # Spec Score Distribution
     st.subheader("Spec Score Distribution")
-    fig_spec_dist = px.histogram(df, x='Spec_Score', nbins=30, color='Brand',
-                                 title="Distribution of Specification Scores",
-                                 labels={"Spec_Score": "Specification Score", "Brand": "Laptop Brand"})
-    fig_spec_dist.update_layout(
-        plot_bgcolor="rgba(0, 0, 0, 0)",
-        paper_bgcolor="rgba(0, 0, 0, 0)",
-        font=dict(color="white")
-    )
-    st.plotly_chart(fig_spec_dist, use_container_width=True)
+    st.plotly_chart(charts.spec_score_distribution(df), use_container_width=True)
 
     # Top 10 Laptops by Spec Score
     st.subheader("Top 10 Laptops by Spec Score")
-    top_10_spec = df.nlargest(10, 'Spec_Score')
-    fig_top_10_spec = px.bar(top_10_spec, x='Series', y='Spec_Score', color='Brand',
-                             title="Top 10 Laptops by Specification Score",
-                             labels={"Series": "Laptop Series", "Spec_Score": "Specification Score", "Brand": "Laptop Brand"})
-    fig_top_10_spec.update_layout(
-        plot_bgcolor="rgba(0, 0, 0, 0)",
-        paper_bgcolor="rgba(0, 0, 0, 0)",
-        font=dict(color="white")
-    )
-    st.plotly_chart(fig_top_10_spec, use_container_width=True)
+    st.plotly_chart(charts.top_10_by_spec_score(df), use_container_width=True)
 
     # Spec Score vs. RAM Capacity
     st.subheader("Spec Score vs. RAM Capacity")
-    fig_spec_ram = px.scatter(df, x='Ram_Capacity(GB)', y='Spec_Score', color='Brand',
-                              title="Specification Score vs. RAM Capacity",
-                              labels={"Ram_Capacity(GB)": "RAM Capacity (GB)", "Spec_Score": "Specification Score", "Brand": "Laptop Brand"})
-    fig_spec_ram.update_layout(
-        plot_bgcolor="rgba(0, 0, 0, 0)",
-        paper_bgcolor="rgba(0, 0, 0, 0)",
-        font=dict(color="white")
-    )
-    st.plotly_chart(fig_spec_ram, use_container_width=True)
+    st.plotly_chart(charts.spec_score_vs_ram(df), use_container_width=True)
 
 # display design analysis
 
@@ -335,42 +219,15 @@ def display_design_analysis():
 
     # Screen Size Distribution
     st.subheader("Screen Size Distribution")
-    fig_screen_size_dist = px.histogram(df, x='Display Size (Inches)', nbins=20, color='Brand',
-                                        title="Distribution of Screen Sizes",
-                                        labels={"Display Size (Inches)": "Screen Size (inches)", "Brand": "Laptop Brand"})
-    fig_screen_size_dist.update_layout(
-        plot_bgcolor="rgba(0, 0, 0, 0)",
-        paper_bgcolor="rgba(0, 0, 0, 0)",
-        font=dict(color="white")
-    )
-    st.plotly_chart(fig_screen_size_dist, use_container_width=True)
+    st.plotly_chart(charts.screen_size_distribution(df), use_container_width=True)
 
     # Resolution Distribution
     st.subheader("Resolution Distribution")
-    df['Resolution'] = df['Resolution Width'].astype(str) + 'x' + df['Resolution Height'].astype(str)
-    resolution_counts = df['Resolution'].value_counts().reset_index()
-    resolution_counts.columns = ['Resolution', 'Count']
-    fig_resolution_dist = px.bar(resolution_counts, x='Resolution', y='Count', color='Resolution',
-                                 title="Distribution of Screen Resolutions",
-                                 labels={"Resolution": "Screen Resolution", "Count": "Count"})
-    fig_resolution_dist.update_layout(
-        plot_bgcolor="rgba(0, 0, 0, 0)",
-        paper_bgcolor="rgba(0, 0, 0, 0)",
-        font=dict(color="white")
-    )
-    st.plotly_chart(fig_resolution_dist, use_container_width=True)
+    st.plotly_chart(charts.resolution_distribution(df), use_container_width=True)
 
     # PPI vs. Price
     st.subheader("PPI vs. Price")
-    fig_ppi_price = px.scatter(df, x='PPI', y='Price', color='Brand',
-                               title="PPI vs. Price",
-                               labels={"PPI": "Pixels Per Inch (PPI)", "Price": "Price in Rupees", "Brand": "Laptop Brand"})
-    fig_ppi_price.update_layout(
-        plot_bgcolor="rgba(0, 0, 0, 0)",
-        paper_bgcolor="rgba(0, 0, 0, 0)",
-        font=dict(color="white")
-    )
-    st.plotly_chart(fig_ppi_price, use_container_width=True)
+    st.plotly_chart(charts.ppi_vs_price(df), use_container_width=True)
 
 
 
@@ -379,42 +236,113 @@ def additional_insights():
 
     # Operating System Distribution
     st.subheader("Operating System Distribution")
-    os_counts = df['OS Type'].value_counts().reset_index()
-    os_counts.columns = ['OS Type', 'Count']
-    fig_os_dist = px.pie(os_counts, values='Count', names='OS Type',
-                         title="Operating System Distribution")
-    fig_os_dist.update_layout(
-        plot_bgcolor="rgba(0, 0, 0, 0)",
-        paper_bgcolor="rgba(0, 0, 0, 0)",
-        font=dict(color="white")
-    )
-    st.plotly_chart(fig_os_dist, use_container_width=True)
+    st.plotly_chart(charts.os_distribution(df), use_container_width=True)
 
     # Graphics Brand Distribution
     st.subheader("Graphics Brand Distribution")
-    graphics_counts = df['Graphics_Brand'].value_counts().reset_index()
-    graphics_counts.columns = ['Graphics_Brand', 'Count']
-    fig_graphics_dist = px.bar(graphics_counts, x='Graphics_Brand', y='Count', color='Graphics_Brand',
-                               title="Graphics Brand Distribution",
-                               labels={"Graphics_Brand": "Graphics Brand", "Count": "Count"})
-    fig_graphics_dist.update_layout(
-        plot_bgcolor="rgba(0, 0, 0, 0)",
-        paper_bgcolor="rgba(0, 0, 0, 0)",
-        font=dict(color="white")
-    )
-    st.plotly_chart(fig_graphics_dist, use_container_width=True)
+    st.plotly_chart(charts.graphics_brand_distribution(df), use_container_width=True)
 
     # Weight vs. Price
     st.subheader("Weight vs. Price")
-    fig_weight_price = px.scatter(df, x='Weight(kg)', y='Price', color='Brand',
-                                  title="Weight vs. Price",
-                                  labels={"Weight(kg)": "Weight (kg)", "Price": "Price in USD", "Brand": "Laptop Brand"})
-    fig_weight_price.update_layout(
-        plot_bgcolor="rgba(0, 0, 0, 0)",
-        paper_bgcolor="rgba(0, 0, 0, 0)",
-        font=dict(color="white")
-    )
-    st.plotly_chart(fig_weight_price, use_container_width=True)
+    st.plotly_chart(charts.weight_vs_price(df), use_container_width=True)
+
+
+@st.cache_data
+def series_trajectory(series, brand, snapshots):
+    # snapshots is part of the cache key so a new snapshot invalidates it.
+    return price_history.series_trajectory(series, brand=brand)
+
+
+@st.cache_data
+def brand_price_moves(start, end, threshold, snapshots):
+    return price_history.brand_price_moves(start, end, threshold)
+
+
+def price_trends():
+    st.title("Price Trends")
+
+    snapshots = tuple(price_history.snapshots())
+    if not snapshots:
+        st.info("No price history yet. Add a snapshot with "
+                "`python -m src.data.price_history append df.csv <label>` "
+                "from the repository root.")
+        return
+    st.write(f"{len(snapshots)} snapshots: {', '.join(snapshots)}")
+
+    # Price Trajectory for a Series
+    st.subheader("Price Trajectory by Series")
+    selected_brand = st.selectbox("Select a Brand", sorted(df['Brand'].unique()))
+    series_list = sorted(df.loc[df['Brand'] == selected_brand, 'Series'].astype(str).unique())
+    selected_series = st.selectbox("Select a Series", series_list)
+    trajectory = series_trajectory(selected_series, selected_brand, snapshots)
+    if trajectory.empty:
+        st.write("This series does not appear in the price history.")
+    else:
+        st.plotly_chart(charts.series_price_trend(trajectory, selected_series),
+                        use_container_width=True)
+        st.dataframe(trajectory)
+
+    # Brands whose Average Price Moved
+    if len(snapshots) < 2:
+        return
+    st.subheader("Brands with the Largest Average Price Moves")
+    start, end = st.select_slider("Compare snapshots", options=snapshots,
+                                  value=(snapshots[-2], snapshots[-1]))
+    if start == end:
+        st.info("Select two different snapshots to compare.")
+        return
+    threshold = st.slider("Minimum change (%)", 0.0, 50.0, 5.0, 0.5)
+    moves = brand_price_moves(start, end, threshold, snapshots)
+    if moves.empty:
+        st.write(f"No brand moved more than {threshold:.1f}% between {start} and {end}.")
+    else:
+        st.plotly_chart(charts.brand_price_moves(moves, start, end), use_container_width=True)
+        st.dataframe(moves)
+
+
+@st.cache_data
+def correlation_stats(version):
+    # Start from the running sums saved by the pipeline; when they lag
+    # behind this dataset version only the newer rows are folded in, and
+    # the result is saved so other server processes can reuse it.
+    store = moments.MomentStore.load()
+    saved_version = store.version
+    store = moments.catch_up(store, df, version=version)
+    if store.version != saved_version:
+        store.save()
+    overall = store.correlation()
+    by_brand = {brand: store.correlation(brand) for brand in sorted(store.groups)}
+    return overall, by_brand
+
+
+def correlation_analysis():
+    st.title("Correlation Analysis")
+
+    overall, by_brand = correlation_stats(df_version)
+
+    # Correlation Matrix
+    st.subheader("Correlation Matrix")
+    st.plotly_chart(charts.correlation_heatmap(overall), use_container_width=True)
+
+    # Strongest Relationships
+    st.subheader("Strongest Relationships")
+    pairs = overall.where(np.triu(np.ones(overall.shape, dtype=bool), k=1)).stack()
+    pairs = pairs.reindex(pairs.abs().sort_values(ascending=False).index)
+    pairs = pairs.rename('Correlation').rename_axis(['Feature', 'Compared With']).reset_index()
+    st.dataframe(pairs.head(10))
+
+    # Correlation with Price by Brand
+    st.subheader("Correlation with Price by Brand")
+    price_corr = pd.DataFrame({brand: corr['Price'] for brand, corr in by_brand.items()}).T
+    price_corr = price_corr.drop(columns='Price')
+    st.plotly_chart(charts.price_correlation_by_brand(price_corr), use_container_width=True)
+
+    # Correlation Matrix for a Brand
+    st.subheader("Correlation Matrix by Brand")
+    selected_brand = st.selectbox("Select a Brand", list(by_brand))
+    st.plotly_chart(charts.correlation_heatmap(by_brand[selected_brand],
+                                               title=f"Correlation Matrix for {selected_brand}"),
+                    use_container_width=True)
 
 
 def conclusion_recommendations():
@@ -445,6 +373,13 @@ def conclusion_recommendations():
        - Weight is an important factor influencing the price of laptops, with lighter laptops generally being more expensive.
     """)
 
+    # Correlations behind the findings, computed from the current dataset
+    overall, _ = correlation_stats(df_version)
+    col1, col2, col3 = st.columns(3)
+    col1.metric("RAM vs. Spec Score", f"{overall.loc['Ram_Capacity(GB)', 'Spec_Score']:.2f}")
+    col2.metric("PPI vs. Price", f"{overall.loc['PPI', 'Price']:.2f}")
+    col3.metric("Weight vs. Price", f"{overall.loc['Weight(kg)', 'Price']:.2f}")
+
     st.subheader("Recommendations")
     st.write("""
     Based on the key findings, here are some actionable recommendations for stakeholders:
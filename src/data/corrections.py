@@ -0,0 +1,507 @@
+# -*- coding: utf-8 -*-
+""" Hand-collected corrections applied by make_dataset, carried over from
+    the cleaning notebooks.
+
+    Rules here are keyed by processor or by part of the listing name, so
+    they apply to every listing that matches. Values looked up for a single
+    listing live in data/external/listing_fixes.csv instead.
+"""
+
+# Listings scraped without processor details, keyed by part of the name.
+MISSING_PROCESSORS = {
+    'Lenovo Ideapad Gaming 3 15IHU6': {
+        'Processor': 'Intel Core i5-11300H (11th Gen)',
+        'Clock-speed': '3.1 GHz',
+        'Operating System': 'Windows 11 Home',
+    },
+    'Dell Vostro 3401': {
+        'Processor': 'Intel Core i3-1005G1 (10th Gen)',
+        'Clock-speed': '1.2 GHz',
+        'Operating System': 'Windows 10 Home',
+    },
+    'Dell Inspiron 15 3511': {
+        'Processor': 'Intel Core i3-1115G4 (11th Gen)',
+        'Clock-speed': '3.0 GHz',
+        'Operating System': 'Windows 10 Home',
+    },
+}
+
+# RAM types by part of the name, applied in order so later entries win.
+# Apple silicon has unified memory, recorded as the chip.
+RAM_TYPES = [
+    ('M1 Pro', 'M1 Pro'),
+    ('M2', 'M2'),
+    ('M3', 'M3'),
+    ('Asus VivoBook 15 X515EA-EJ322WS', 'DDR4'),
+    ('Honor MagicBook X 14', 'DDR4'),
+    ('Tecno MEGABOOK T1', 'DDR4'),
+    ('Lenovo Ideapad Gaming 3 15IHU6', 'DDR4'),
+    ('Dell Vostro 3401', 'DDR4'),
+    ('Asus VivoBook Flip 14 TP470EA-EC311WS', 'DDR4'),
+    ('Dell Vostro 14 3400', 'DDR4'),
+    ('Samsung Galaxy Book 3 360 NP730QFG-KA2IN', 'LPDDR4X'),
+    ('Samsung Galaxy Book 3 360 NP750QFG-KA3IN', 'LPDDR4X'),
+    ('Samsung Galaxy Book 3 360 NP750QFG-KA1IN', 'LPDDR4X'),
+    ('Samsung Galaxy Book 3 360 NP730QFG-KA1IN', 'LPDDR4X'),
+    ('Samsung Galaxy Book 3 360 NP750QFG-KA2IN', 'LPDDR4X'),
+    ('Lenovo Ideapad 5 Pro 14ACN6', 'DDR4'),
+    ('Samsung Galaxy Book 3 Pro 360 NP960QFG-KA1IN', 'LPDDR4X'),
+    ('Samsung Galaxy Book 3 Pro 360 Intel Evo NP960QFG-KA3IN', 'LPDDR4X'),
+    ('Samsung Galaxy Book 3 Pro 360 NP960QFG-KA2IN', 'LPDDR4X'),
+    ('Samsung Galaxy Book 3 Pro Intel Evo NP940XFG-KC1IN', 'LPDDR4X'),
+    ('Apple MacBook Pro M1 Max MK1A3HN/A', 'M1 Max'),
+    ('Asus Vivobook 16X K3605ZV-MBN741WS', 'DDR4'),
+    ('Asus Vivobook 16X K3605ZU-MBN541WS', 'DDR4'),
+    ('Dell Inspiron 15 3511', 'DDR4'),
+]
+
+# Core counts for processors whose name does not spell them out.
+CORE_CONFIGURATIONS = {
+    'Intel Core i5-1155G7 (11th Gen)': 'Quad Core',
+    'Intel Core i3-1215U (12th Gen)': 'Hexa Core',
+    'Intel Core i7-13700HX (13th Gen)': 'Octa Core',
+    'Intel Core i5-11400H (11th Gen)': 'Hexa Core',
+    'Intel Core i5-1235U (12th Gen)': 'Deca Core',
+    'AMD Quad-Core E2-7110': 'Quad Core',
+    'Intel Evo Core i7-12700H (12th Gen)': 'Deca Core',
+    'Intel Core i5-3317U (3rd Gen)': 'Dual Core',
+    'Intel Core i5-6200U (5th Gen)': 'Dual Core',
+    'Intel Core i5-8279U (8th Gen)': 'Quad Core',
+    'Intel Core i5-L16G7 (11th Gen)': 'Quad Core',
+    'Intel Core i7 (10th Gen)': 'Octa Core',
+    'Intel Core i7 (11th Gen)': 'Octa Core',
+    'Intel Core i7 - 1165G7 (11th Gen)': 'Quad Core',
+    'Intel Core i9-12900H': 'Deca Core',
+    'Intel Core i9-8950HK (8th Gen)': 'Deca Core',
+    'Intel Core i9-9980HK (10th Gen)': 'Deca Core',
+    'Intel EVO Core i5-12500H (12th Gen)': 'Deca Core',
+    'Intel EVO Core i7-12700H (12th Gen)': 'Deca Core',
+    'Intel Evo Core i9-12900H (12th Gen)': 'Deca Core',
+    'AMD Ryzen 5 5600H': 'Hexa Core',
+    'Intel Lake Core i5-1135G7 (11th Gen)': 'Quad Core',
+    'Intel Pentium Silver - N6000': 'Quad Core',
+    'Intel Pentium Silver N6005': 'Quad Core',
+    'Intel Pentium Silver- N5030': 'Quad Core',
+    'Intel Pentium Silver-N6000': 'Quad Core',
+    'Intel i5-11320H (11th Gen)': 'Quad Core',
+    'MediaTek Kompanio 1200': 'Octa Core',
+    'MediaTek Kompanio 520': 'Octa Core',
+    'Mediatek MT8788': 'Octa Core',
+    'Qualcomm Snapdragon 7c': 'Octa Core',
+    'Qualcomm Snapdragon 7c Computer': 'Octa Core',
+    'Qualcomm Snapdragon 7c Gen 2': 'Octa Core',
+    'Intel Core i5-13420H': 'Deca Core',
+    'Intel Core i5-1335U': 'Deca Core',
+    'Intel Core i5-1135G7': 'Quad Core',
+    'Intel Core i5-1135G4 (11th Gen)': 'Quad Core',
+    'AMD Ryzen 9 5900HX': 'Octa Core',
+    'Apple M1 Max': 'Deca Core',
+    'Apple M1 Pro': 'Octa Core',
+    'Apple M2 Chip': 'Octa Core',
+    'Intel Atom Quad-Core x5-Z8350': 'Quad Core',
+    'Intel Celeron - N4020': 'Dual Core',
+    'Intel Celeron - N4500': 'Dual Core',
+    'Intel Celeron N4020': 'Dual Core',
+    'Intel Celeron Processor - N5100': 'Quad Core',
+    'Intel Core 3 - 100U (Series 1)': 'Deca Core',
+    'Intel Core i3 - 1215U (12th Gen)': 'Deca Core',
+    'Intel Core i3-1005G1': 'Quad Core',
+    'Intel Core i3-1115G4': 'Dual Core',
+    'Intel Core i3-1135G7 (11th Gen)': 'Quad Core',
+    'Intel Core i3-1315U': 'Deca Core',
+    'Intel Core i3-7020U (7th Gen)': 'Dual Core',
+    'Intel Core i3-N305 (11th Gen)': 'Octa Core',
+    'Intel Core i3-N305 (13th Gen)': 'Octa Core',
+    'Intel Core i5 (10th Gen)': 'Quad Core',
+    'Intel Core i5 - 12500H (12th Gen)': 'Deca Core',
+    'Intel Core i5 - 1335U (13th Gen)': 'Deca Core',
+    'Intel Core i5- 8250U (8th Gen)': 'Quad Core',
+    'Intel Core i5-10210u (10th Gen)': 'Quad Core',
+    'Intel Core i5-1035G1 (11th Gen)': 'Quad Core',
+    'Intel Core i5-1125G4 (11th Gen)': 'Quad Core',
+    'intel Core i3-1115G4 (11th Gen)': 'Dual Core',
+    'AMD Athlon Gold-A3150U': 'Dual Core',
+    'AMD Quad-Core A10-8700P': 'Quad Core',
+    'Intel Core i9-13980H (13th Gen)': 'Deca Core',
+    'Intel Core i9-13950HX (13th Gen)': 'Deca Core',
+    'Intel Core i9-12900H (8th Gen)': 'Deca Core',
+    'Intel Core i7-8650U (8th Gen)': 'Quad Core',
+    'Intel Core i7-7Y75 (7th Gen)': 'Dual Core',
+    'Intel Core i7-7700HQ (7th Gen)': 'Quad Core',
+    'Intel Core i7-7660U (7th Gen)': 'Dual Core',
+    'Intel Core i7-1255U': 'Deca Core',
+    'Intel Core i7-11800Hi (11th Gen)': 'Octa Core',
+    'Intel Core i7-10870H (10th Gen)': 'Octa Core',
+    'Intel Core i7-10510Y (10th Gen)': 'Quad Core',
+    'Intel Core i7 13700HX (13th Gen)': 'Deca Core',
+    'AMD Hexadeca Core Ryzen 9 - 7945HX': 'Hexadeca Core',
+    'Intel Core i9-13900HK (13th Gen)': 'Deca Core',
+    'Intel Core i7-13650H (13th Gen)': 'Octa Core',
+    'Intel Core i7-13700HX': 'Octa Core',
+    'Intel Core i7-6700HQ (6th Gen)': 'Quad Core',
+    'Apple M1': 'Octa Core',
+    'Intel Core i7-1065G7 (10th Gen)': 'Quad Core',
+    'Intel Core i5-6200U (6th Gen)': 'Dual Core',
+    'Intel Core i3-8130U (8th Gen)': 'Dual Core',
+    'Intel Core i3-7100U (7th Gen)': 'Dual Core',
+    'Intel Core i3-6006U (6th Gen)': 'Dual Core',
+    'Intel Core i5-1155G7': 'Quad Core',
+    'Intel Core i3-1115G4 (10th Gen)': 'Dual Core',
+    'Intel Core i5-1235UG4 (12th Gen)': 'Deca Core',
+    'Intel Core i5-12450H': 'Hexa Core',
+    'Intel Pentium Silver N6000': 'Quad Core',
+    'AMD Ryzen 7-6800H': 'Octa Core',
+    'Intel Core i7-12650H': 'Deca Core',
+    'MediaTek MT8788': 'Octa Core',
+    'Intel Core i7-8500Y (8th Gen)': 'Dual Core',
+    'Intel Core i9-11980HK (11th Gen)': 'Octa Core',
+    'Intel Core i9-10885H (10th Gen)': 'Octa Core',
+    'Intel Core i9 - 13900HX (13th Gen)': 'Deca Core',
+    'Intel Core i7-11390H (11th Gen)': 'Quad Core',
+    'Intel Core i7-11700H (11th Gen)': 'Octa Core',
+    'Intel Core i3-1315U (13th Gen)': 'Dual Core',
+    'Intel Core i3-10110U (10th Gen)': 'Dual Core',
+    'Intel Core i9-13900H (13th Gen)': 'Deca Core',
+    'Intel Core i5-10300H (10th Gen)': 'Quad Core',
+    'Intel Core i7-13620H (13th Gen)': 'Octa Core',
+    'Intel Core i5-10210U (10th Gen)': 'Quad Core',
+    'Intel Core i3-1125G4 (11th Gen)': 'Quad Core',
+    'Intel Core i9-12900H (12th Gen)': 'Deca Core',
+    'Intel Core i7-10510U (10th Gen)': 'Quad Core',
+    'Intel Core i5-8250U (8th Gen)': 'Quad Core',
+    'Intel Core i3-N305 (12th Gen)': 'Octa Core',
+    'Intel Core i7-14700HX (14th Gen)': 'Deca Core',
+    'Intel Core i5-11320H (11th Gen)': 'Quad Core',
+    'Apple M2': 'Octa Core',
+    'Intel Core i3-1305U (13th Gen)': 'Dual Core',
+    'Intel Core i9-11900H (11th Gen)': 'Octa Core',
+    'Intel Core i5-10200H (10th Gen)': 'Quad Core',
+    'Intel Core i5-1230U (12th Gen)': 'Deca Core',
+    'Intel Core i7-8550U (8th Gen)': 'Quad Core',
+    'Intel Core i7-1250U (12th Gen)': 'Deca Core',
+    'Intel Core i5-9300H (9th Gen)': 'Quad Core',
+    'Intel Core i5-10500H (10th Gen)': 'Hexa Core',
+    'Intel Core i7-8750H (8th Gen)': 'Hexa Core',
+    'Intel Core i3-1215U': 'Hexa Core',
+    'Intel Core i3-1035G1 (10th Gen)': 'Quad Core',
+    'Intel Core i5-1335U (13th Gen)': 'Deca Core',
+    'Intel Core i7-12700H (12th Gen)': 'Octa Core',
+    'Intel Core i7-12650H (12th Gen)': 'Octa Core',
+    'Intel Core i3-1005G1 (10th Gen)': 'Dual Core',
+    'Intel Core i5-12500H (12th Gen)': 'Hexa Core',
+    'Intel Core i7-1255U (12th Gen)': 'Deca Core',
+    'Intel Core i7-1165G7 (11th Gen)': 'Quad Core',
+    'Intel Core i7-1355U (13th Gen)': 'Deca Core',
+    'Intel Core Ultra 7 - 155H': 'Deca Core',
+    'Intel Core i7-1360P (13th Gen)': 'Deca Core',
+    'Intel Core i5-1340P (13th Gen)': 'Deca Core',
+    'Apple M3': 'Octa Core',
+    'Intel Core i9-14900HX (14th Gen)': 'Deca Core',
+    'Intel Core Ultra 5 - 125H': 'Deca Core',
+    'Intel Core i7-1195G7 (11th Gen)': 'Quad Core',
+    'Intel Core Ultra 9 - 185H': 'Deca Core',
+    'Apple M3 Pro': 'Octa Core',
+    'Intel Core i5-13450HX (13th Gen)': 'Deca Core',
+    'Intel Core i9-13980HX (13th Gen)': 'Deca Core',
+    'Intel Core i7-13650HX (13th Gen)': 'Octa Core',
+    'Intel Core i5-7200U (7th Gen)': 'Dual Core',
+    'Apple M2 Pro': 'Octa Core',
+    'Intel Core Ultra 7 - 155U': 'Octa Core',
+    'Apple M3 Max': 'Deca Core',
+    'Intel Core i7-10750H (10th Gen)': 'Hexa Core',
+    'Intel Core 5 - 120U (Series 1)': 'Deca Core',
+    'Intel Core i5-12450HX (12th Gen)': 'Hexa Core',
+    'Intel Core i5-8265U (8th Gen)': 'Quad Core',
+    'Intel Core i7-7500U (7th Gen)': 'Dual Core',
+    'Intel Core i7-14650HX (14th Gen)': 'Octa Core',
+    'Intel Core i7-11370H (11th Gen)': 'Quad Core',
+    'Intel Core 7 - 150U (Series 1)': 'Octa Core',
+    'Intel Core i5-5200U (5th Gen)': 'Dual Core',
+    'Intel Core i5-13500HX (13th Gen)': 'Deca Core',
+    'Intel Core i9-12900HK (12th Gen)': 'Deca Core',
+    'Intel Core i7-12800H (12th Gen)': 'Deca Core',
+    'Intel Core i9-13900HX (13th Gen)': 'Deca Core',
+    'AMD Ryzen 7 5800H': 'Octa Core',
+    'Apple M2 Max': 'Deca Core',
+    'Intel Core i7-10875H (10th Gen)': 'Octa Core',
+    'Intel Pentium Gold - 7505': 'Dual Core',
+    'Intel Core i9-12950HX (12th Gen)': 'Deca Core',
+    'Intel Core i5-1035G4 (10th Gen)': 'Quad Core',
+    'Intel Core i7-1355U': 'Deca Core',
+    'Intel Core i7-13620H': 'Octa Core',
+    'Intel Core i5-1115G4 (11th Gen)': 'Dual Core',
+    'Intel Core i7-1280P (12th Gen)': 'Deca Core',
+    'Intel Core i5-7Y54 (7th Gen)': 'Dual Core',
+    'Intel Core Ultra 5 - 125U': 'Deca Core',
+    'Intel Core i7-4510U (4th Gen)': 'Dual Core',
+    'Intel Core i7-1185G7 (11th Gen)': 'Quad Core',
+    'Intel Core i5-1334U (13th Gen)': 'Deca Core',
+    'Intel Core i7-12450H (12th Gen)': 'Hexa Core',
+    'Intel Core i7-1255UG4 (12th Gen)': 'Deca Core',
+    'Intel Core i7-12800HX (12th Gen)': 'Deca Core',
+    'Intel Core i7-11800H (11th Gen)': 'Octa Core',
+    'Intel Core i7-13700H (13th Gen)': 'Deca Core',
+    'Intel Core i5-13500H (13th Gen)': 'Deca Core',
+    'Intel Core i5-11300H (11th Gen)': 'Quad Core',
+    'Intel Core i7-1260P (12th Gen)': 'Deca Core',
+    'Intel Core i5-11260H (11th Gen)': 'Hexa Core',
+    'Intel Core i5-1135G7 (11th Gen)': 'Quad Core',
+    'Intel Core i3-1115G4 (11th Gen)': 'Dual Core',
+    'Intel Core i5-1035G1 (10th Gen)': 'Quad Core',
+    'AMD Ryzen 5 5500U': 'Hexa Core',
+    'Intel Core i5-12450H (12th Gen)': 'Hexa Core',
+    'Intel Core i3-1220P (12th Gen)': 'Deca Core',
+    'Intel Core i5-13420H (13th Gen)': 'Hexa Core',
+    'Intel Core i5-1240P (12th Gen)': 'Deca Core',
+    'Apple M3 Chip': 'Octa Core',
+}
+
+# Processor families for processors the Series pattern does not match.
+PROCESSOR_SERIES = {
+    'AMD Dual Core Athlon - 3050U': 'Athlon Series',
+    'Intel Celeron Dual Core N3350': 'Celeron N Series',
+    'Intel Celeron Quad Core- N5100': 'Celeron N Series',
+    'AMD Dual Core Athlon-3050U': 'Athlon Series',
+    'AMD Dual Core Athlon 3050U': 'Athlon Series',
+    'Intel Celeron Dual Core N3060': 'Celeron N Series',
+    'Intel Pentium Quad Core N6000': 'Pentium Silver Series',
+    'Intel Pentium Quad Core N5030': 'Pentium Silver Series',
+    'Intel Pentium Silver N6000': 'Pentium Silver Series',
+    'AMD Dual Core A6-9225': 'A6 Series',
+    'Intel Celeron Dual Core - N3350': 'Celeron N Series',
+    'AMD Athlon Dual Core - 7120U': 'Athlon Series',
+    'Intel Celeron-N4020': 'Celeron N Series',
+    'AMD Athlon Gold-A3150U': 'Athlon Gold Series',
+    'Intel Celeron N4500': 'Celeron N Series',
+    'Intel Core 3 - 100U (Series 1)': 'Core i3 Series',
+    'Intel Pentium Dual Core - T6600': 'Pentium Series',
+    'AMD Dual Core A6 9225': 'A6 Series',
+    'AMD Dual Core A9-9425': 'A9 Series',
+    'Intel Celeron Processor - N5100': 'Celeron N Series',
+    'Intel Pentium Quad Core - N5030': 'Pentium Silver Series',
+    'AMD Dual Core Athlon - 3020e': 'Athlon Series',
+    'Intel Pentium Quad Core Silver- N5030': 'Pentium Silver Series',
+    'Intel Pentium Silver - N6000': 'Pentium Silver Series',
+    'AMD Dual Core Athlon - 3045B Pro': 'Athlon Pro Series',
+    'AMD Dual Core Athlon - 3150U': 'Athlon Series',
+    'Qualcomm Snapdragon 7c Computer': 'Snapdragon Series',
+    'Qualcomm Snapdragon 7c': 'Snapdragon Series',
+    'MediaTek Octa Core P60T': 'MediaTek P Series',
+    'AMD Dual Core Athlon 3150U': 'Athlon Series',
+    'Intel Celeron Dual Core N4500': 'Celeron N Series',
+    'MediaTek Kompanio 520': 'Kompanio Series',
+    'MediaTek Kompanio 1200': 'Kompanio Series',
+    'Intel i5-11320H (11th Gen)': 'Core i5 Series',
+    'AMD Dual Core Athlon 3300U': 'Athlon Series',
+    'AMD Dual Core Athlon A3045B': 'Athlon Series',
+    'Intel Pentium Dual Core 4415U': 'Pentium Series',
+    'Intel Pentium Quad Core - N100': 'Pentium Silver Series',
+    'Intel Pentium Quad Core N3530': 'Pentium Series',
+    'Intel Pentium Silver N6005': 'Pentium Silver Series',
+    'Intel Pentium Silver-N6000': 'Pentium Silver Series',
+    'Intel Pentium Silver- N5030': 'Pentium Silver Series',
+    'Intel Quad Core Pentium Silver N6000': 'Pentium Silver Series',
+    'Intel Quad Core Pentium Silver-N6000': 'Pentium Silver Series',
+    'Intel Core 5 - 120U (Series 1)': 'Core i5 Series',
+    'Intel Core 7 - 150U (Series 1)': 'Core i7 Series',
+    'Intel Celeron Dual Core - N4020': 'Celeron N Series',
+    'Intel Celeron Dual Core - N4500': 'Celeron N Series',
+    'Intel Celeron Dual Core- N4020': 'Celeron N Series',
+    'Intel Celeron Dual Core N4020': 'Celeron N Series',
+    'Intel Celeron Dual Core- N4500': 'Celeron N Series',
+}
+
+# Colour names are title-cased, then mapped through these three tables in
+# turn: marketing names to plain colours, misspellings, and whatever the
+# first two left over.
+COLOUR_NAMES = {
+    'Pure Silver': 'Silver',
+    'Natural Silver': 'Silver',
+    'Icelight Silver': 'Silver',
+    'Transparent Silver': 'Silver',
+    'Mineral Silver': 'Silver',
+    'Platinum Silver': 'Silver',
+    'Cool Silver': 'Silver',
+    'Mica Silver': 'Silver',
+    'Moonshine Silver': 'Silver',
+    'Cloud Silver': 'Silver',
+    'Meteor Silver': 'Silver',
+    'Ultimate Grey': 'Grey',
+    'Cloud Grey': 'Grey',
+    'Arctic Grey': 'Grey',
+    'Space Grey': 'Grey',
+    'Dark Grey': 'Grey',
+    'Slate Grey': 'Grey',
+    'Iron Grey': 'Grey',
+    'Onyx Grey': 'Grey',
+    'Platinum Grey': 'Grey',
+    'Phantom Grey': 'Grey',
+    'Ash Grey': 'Grey',
+    'Charcoal Grey': 'Grey',
+    'Mineral Grey': 'Grey',
+    'Titan Grey': 'Grey',
+    'Lunar Grey': 'Grey',
+    'Mecha Grey': 'Grey',
+    'Foggy Silver': 'Grey',
+    'Dark Shadow Grey': 'Grey',
+    'Jaeger Gray': 'Grey',
+    'Star Grey': 'Grey',
+    'Starfall Grey': 'Grey',
+    'Eclipse Grey': 'Grey',
+    'Pike Silver': 'Silver',
+    'Mixed Black': 'Black',
+    'Charcoal Black': 'Black',
+    'Shadow Black': 'Black',
+    'Jet Black': 'Black',
+    'Obsidian Black': 'Black',
+    'Carbon Black': 'Black',
+    'Black Plastic': 'Black',
+    'Matte Black': 'Black',
+    'Phantom Black': 'Black',
+    'Indie Black': 'Black',
+    'Jade Black': 'Black',
+    'Abyssal Black': 'Black',
+    'Ink Black': 'Black',
+    'Tech Black': 'Black',
+    'Nocturne Black': 'Black',
+    'Nightfall Black': 'Black',
+    'Dark Ash Black': 'Black',
+    'Poseidon Blue': 'Blue',
+    'Storm Grey': 'Grey',
+    'Cosmic Blue': 'Blue',
+    'Quiet Blue': 'Blue',
+    'Deep Dive Blue': 'Blue',
+    'Performance Blue': 'Blue',
+    'Royal Blue': 'Blue',
+    'Sapphire': 'Blue',
+    'Atlantic Blue': 'Blue',
+    'Soft Mint': 'Green',
+    'Brave Green': 'Green',
+    'Green Grey': 'Green',
+    'Forest Teal': 'Green',
+    'Aurora Green': 'Green',
+    'Lilac Mist': 'Purple',
+    'Peacock Blue': 'Blue',
+    'Solid Gray': 'Grey',
+    'Luxury Gold': 'Gold',
+    'Champagne Gold': 'Gold',
+    'Warm Gold': 'Gold',
+    'Rose Gold': 'Gold',
+    'Noble Red': 'Red',
+    'Resolute Red': 'Red',
+    'Cognac Brown': 'Brown',
+    'Ceramic White': 'White',
+    'Moonlight White': 'White',
+    'Pure White': 'White',
+    'Dreamy White': 'White',
+    'Moon White': 'White',
+    'Lustrous Grey': 'Grey',
+    'Indigo Blue': 'Blue',
+    'Phantom Blue': 'Blue',
+    'Midnight': 'Black',
+    'Sage Green': 'Green',
+    'Tranquil Pink': 'Pink',
+}
+
+COLOUR_SPELLINGS = {
+    'Â€Žmineral Grey': 'Mineral Grey',
+    'Â€Žstorm Grey': 'Storm Grey',
+    'Â€Žcore Black': 'Core Black',
+    'Â€Žcloud Grey': 'Cloud Grey',
+    'Â€Žiron Grey': 'Iron Grey',
+    'Â€Žstellar Gray': 'Stellar Grey',
+    'Â€Žcosmos Gray': 'Cosmos Grey',
+    'Natual Silver': 'Natural Silver',
+    'Eclipse Gray': 'Eclipse Grey',
+    'Asteroild Silver': 'Asteroid Silver',
+}
+
+COLOUR_GROUPS = {
+    'Graphite Black': 'Black',
+    'Shale Black': 'Black',
+    'Phantom Blue, Shadow Black': 'Black',
+    'Bonfire Black': 'Black',
+    'Matt Black': 'Black',
+    'Midnight Black': 'Black',
+    'Classic Black': 'Black',
+    'Charcoal Gray': 'Grey',
+    'Indie Black, Neutral Grey': 'Black',
+    'Eclipse Grey': 'Grey',
+    'Sparkling Black': 'Black',
+    'Quiet Blue, Silver': 'Blue',
+    'Neutral Grey': 'Grey',
+    'Storm Grey (Top), Black (Bottom)': 'Grey',
+    'Space Blue Aluminum': 'Blue',
+    'Eclipse Gray Anime Matrix Version': 'Grey',
+    'Platinum Grey, Abyss Blue, Cherry Red, Almond, Business Black': 'Grey',
+    'Moonstone Gray': 'Grey',
+    'Luna Gray': 'Grey',
+    'Dark Metallic Moon': 'Grey',
+    'Royal Blue, Quartz Grey': 'Blue',
+    'Mystic Silver': 'Silver',
+    'Cosmos Gray': 'Grey',
+    'Atmospheric Blue': 'Blue',
+    'Natural Silver Aluminum': 'Silver',
+    'Meteor Silver Aluminum': 'Silver',
+    'Nouvelle Silver': 'Silver',
+    'Asteroid Silver': 'Silver',
+    'Silver Grey': 'Silver',
+    'Fog Blue Aluminum With A Sandblasted Finish': 'Blue',
+    ('Fog Blue Aluminum Cover, Cloud Blue Base And Cloud Blue Aluminum '
+     'Keyboard Frame'): 'Blue',
+    'Shadow Black Cover And Base, Shadow Black Aluminum Keyboard Frame':
+        'Black',
+    'Nocturne Blue Aluminum, Celestial Blue Accents': 'Blue',
+    'Nightfall Black Aluminum, Pale Brass Accents': 'Black',
+    'Carbon Grey': 'Grey',
+    'Titan Gray': 'Grey',
+    'Titanium Blue': 'Blue',
+    'Ash Gray': 'Grey',
+    'Mecha Gray': 'Grey',
+    'Eclipse Gray': 'Grey',
+    'Slate Grey': 'Grey',
+    'Storm Grey': 'Grey',
+    'Arctic Grey': 'Grey',
+    'Dark Shadow Gray': 'Grey',
+    'Moonlight White': 'White',
+    'Star Grey': 'Grey',
+    'Dark Shadow Grey': 'Grey',
+    'Cool Silver': 'Silver',
+    'Graphite Grey': 'Grey',
+    'Platinum Silver': 'Silver',
+    'Mineral Gray': 'Grey',
+    'Pike Silver Aluminum': 'Silver',
+    'Cosmos Grey': 'Grey',
+    'Jade Black': 'Black',
+    'Abyssal Black': 'Black',
+    'Neutral Grey,Indie Black': 'Grey',
+    'Ponder Blue': 'Blue',
+    'Basalt Grey': 'Grey',
+    'Midnight Blue': 'Blue',
+    'Carbon Gray': 'Grey',
+    'Moonlight Blue': 'Blue',
+    'Abyss Blue': 'Blue',
+    'Sapphire': 'Blue',
+    'Atlantic Blue': 'Blue',
+    'Indigo Blue': 'Blue',
+    'Celestial Blue': 'Blue',
+    'Forest Teal': 'Green',
+    'Brave Green': 'Green',
+    'Aurora Green': 'Green',
+    'Soft Mint': 'Green',
+    'Lilac Mist': 'Purple',
+    'Resolute Red': 'Red',
+    'Noble Red': 'Red',
+    'Luxury Gold': 'Gold',
+    'Champagne Gold': 'Gold',
+    'Rose Gold': 'Gold',
+    'Cognac Brown': 'Brown',
+    'Ceramic White': 'White',
+    'Pure White': 'White',
+    'Dreamy White': 'White',
+    'Moon White': 'White',
+    'White Plastic': 'White',
+    'Purple, Silver': 'Purple',
+}
+
+BRAND_NAMES = {'Hp': 'HP', 'Lg': 'LG', 'Msi': 'MSI'}
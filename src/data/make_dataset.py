@@ -1,8 +1,311 @@
 # -*- coding: utf-8 -*-
-import click
+""" Builds df.csv from the raw scrape, porting the cleaning notebooks.
+
+    impute      Data_Cleaning: price bands, brand, model and processor
+                fields, and the missing clock speeds.
+    clean       Data_Cleaning_2: hand-collected fixes, units parsed out,
+                display, graphics and colour fields.
+    preprocess  Data_Preprocessing: the columns the analysis reads.
+
+    The pipeline runs each step as its own stage, writing the first two to
+    data/interim, so editing one step re-runs only that step and the ones
+    after it.
+"""
 import logging
+import re
 from pathlib import Path
+
+import click
+import numpy as np
+import pandas as pd
 from dotenv import find_dotenv, load_dotenv
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+
+from src.data import corrections
+
+PROJECT_DIR = Path(__file__).resolve().parents[2]
+FIXES_PATH = PROJECT_DIR / 'data' / 'external' / 'listing_fixes.csv'
+
+PRICE_BINS = [0, 30000, 60000, 90000, 120000, np.inf]
+PRICE_RANGES = {
+    'Low': 'Budget',
+    'Medium-Low': 'Economy',
+    'Medium': 'Mid-Range',
+    'Medium-High': 'Premium',
+    'High': 'Luxury',
+}
+PROCESSOR_BRANDS = ['Intel', 'AMD', 'MediaTek', 'Apple']
+CORE_PATTERN = r'(Quad Core|Hexa Core|Octa Core|Dual Core)'
+SERIES_PATTERN = (r'(Ryzen \d+|Core i\d+|Apple M\d+|MT\d+|Pentium Gold'
+                  r'|Core Ultra \d+)')
+GENERATION_PATTERN = r'(\d+th Gen|\d+rd Gen|\d+nd Gen|\d+st Gen)'
+# Listings matching on all of these share a clock speed.
+SIMILAR_LISTING = ['Processor', 'Series', 'Generation', 'Model_Name',
+                   'Brand']
+# Settings the notebook's randomized search picked.
+CLOCK_SPEED_FOREST = dict(n_estimators=300, max_depth=10,
+                          max_features='log2', min_samples_split=2,
+                          min_samples_leaf=1, bootstrap=True,
+                          random_state=42)
+OS_TYPES = [
+    (('Windows',), 'Windows'),
+    (('Mac OS', 'macOS'), 'Macos'),
+    (('Chrome',), 'Chrome'),
+    (('DOS',), 'Dos'),
+    (('Jio OS',), 'Jio'),
+    (('Prime OS',), 'Prime'),
+    (('Linux', 'Ubuntu'), 'Linux'),
+]
+DROPPED_COLUMNS = ['SSD Capacity', 'Aspect Ratio', 'Overall Rating',
+                   'Battery Cell', 'Battery type', 'Power Supply']
+ANTI_GLARE = ['Antiglare', 'Anti-Glare', 'anti-glare', 'Anti-glare',
+              'anti Glare', 'Anti Glare', 'anti glare']
+# Brands with fewer listings are grouped as 'Other'; Original_Brand keeps
+# the name.
+MIN_BRAND_LISTINGS = 15
+
+logger = logging.getLogger(__name__)
+
+
+def load_fixes(path=FIXES_PATH):
+    """ Values looked up by hand for listings the scrape left incomplete,
+        one row per listing name and column.
+    """
+    return pd.read_csv(path, dtype=str, keep_default_na=False)
+
+
+def _apply_fixes(df, fixes, columns):
+    # Only gaps are filled, so a listing the site has since completed keeps
+    # the scraped value.
+    for fix in fixes[fixes['Column'].isin(columns)].itertuples():
+        values = df[fix.Column]
+        gaps = values.isna() | (values == 'Unknown')
+        df.loc[gaps & (df['Name'] == fix.Name), fix.Column] = fix.Value
+
+
+def _model_name(name, brand):
+    model = name.replace(brand, '').split('Laptop')[0].strip()
+    # Dropping the bracketed part code leaves a trailing space, so the
+    # suffix pattern only strips suffixes of names without one.
+    model = re.sub(r'-[A-Za-z0-9]+$', '', re.sub(r'\(.*?\)', '', model))
+    return model.strip()
+
+
+def _processor_brand(processor):
+    for brand in PROCESSOR_BRANDS:
+        if brand.lower() in processor.lower():
+            return brand
+    return 'Unknown'
+
+
+def _os_type(system):
+    for needles, os_type in OS_TYPES:
+        if any(needle in system for needle in needles):
+            return os_type
+    return 'Other'
+
+
+def _mode(values):
+    modes = values.mode()
+    return modes.iloc[0] if len(modes) else np.nan
+
+
+def _predict_clock_speeds(df):
+    """ Clock speeds in GHz, filling the ones still missing with a random
+        forest over the processor, listing name and price.
+    """
+    speeds = pd.to_numeric(
+        df['Clock-speed'].astype(str).str.replace('Ghz', '')
+        .str.replace('GHz', '').str.strip(), errors='coerce')
+
+    def encode(column):
+        return LabelEncoder().fit_transform(df[column].astype(str))
+
+    # The notebook's columns, order and price scaling; with a fixed seed the
+    # forest's feature sampling depends on all three.
+    features = np.column_stack([
+        encode('Processor'), encode('Processor_Brand'),
+        StandardScaler().fit_transform(df[['Price']])[:, 0], encode('Name')])
+    missing = speeds.isna().to_numpy()
+    if missing.any():
+        forest = RandomForestRegressor(**CLOCK_SPEED_FOREST)
+        forest.fit(features[~missing], speeds[~missing])
+        speeds[missing] = forest.predict(features[missing])
+    return speeds.round(2)
+
+
+def impute(df):
+    """ Adds the price band, brand, model and processor fields to the raw
+        scrape and fills in the missing clock speeds.
+    """
+    df = df.copy()
+    df['Price'] = df['Price'].astype(str).str.replace(',', '').astype(float)
+    q1, q3 = df['Price'].quantile([0.25, 0.75])
+    iqr = q3 - q1
+    df['Outlier_Flag'] = ((df['Price'] < q1 - 1.5 * iqr)
+                          | (df['Price'] > q3 + 1.5 * iqr)).astype(int)
+    df.insert(df.columns.get_loc('Price') + 1, 'Price_Range',
+              pd.cut(df['Price'], bins=PRICE_BINS,
+                     labels=list(PRICE_RANGES)))
+    brands = df['Name'].str.split().str[0]
+    df.insert(df.columns.get_loc('Name') + 1, 'Brand', brands)
+    df.insert(df.columns.get_loc('Brand') + 1, 'Model_Name',
+              [_model_name(name, brand)
+               for name, brand in zip(df['Name'], brands)])
+
+    for name, values in corrections.MISSING_PROCESSORS.items():
+        listed = df['Name'].str.contains(name, regex=False)
+        df.loc[listed, list(values)] = list(values.values())
+
+    processors = df['Processor']
+    core = processors.str.extract(CORE_PATTERN, flags=re.IGNORECASE,
+                                  expand=False)
+    processor_columns = {
+        'Processor_Brand': processors.map(_processor_brand),
+        'Core Configuration': core.replace('Quad core', 'Quad Core'),
+        'Series': processors.str.extract(SERIES_PATTERN, flags=re.IGNORECASE,
+                                         expand=False),
+        'Generation': processors.str.extract(
+            GENERATION_PATTERN, flags=re.IGNORECASE, expand=False),
+    }
+    at = df.columns.get_loc('Processor') + 1
+    for offset, (column, values) in enumerate(processor_columns.items()):
+        df.insert(at + offset, column, values.fillna('Unknown'))
+    front = ['Name', 'Brand', 'Model_Name', 'Price', 'Price_Range',
+             'Spec Score', 'Processor'] + list(processor_columns)
+    df = df[front + [column for column in df if column not in front]]
+
+    df['Clock-speed'] = df['Clock-speed'].fillna(
+        df.groupby(SIMILAR_LISTING, dropna=False)['Clock-speed']
+        .transform(_mode))
+    df['Clock-speed'] = _predict_clock_speeds(df)
+    return df
+
+
+def clean(df, fixes):
+    """ Applies the hand-collected fixes and parses the display, weight,
+        graphics and colour fields into the values the analysis uses.
+    """
+    df = df.copy()
+    df['Clock-speed'] = df['Clock-speed'].round(2)
+    df.insert(df.columns.get_loc('Operating System') + 1, 'OS Type',
+              df['Operating System'].fillna('').map(_os_type))
+
+    df['RAM Type'] = df['RAM Type'].str.strip()
+    for name, ram_type in corrections.RAM_TYPES:
+        df.loc[df['Name'].str.contains(name, regex=False),
+               'RAM Type'] = ram_type
+    derived = ['Core Configuration', 'Series', 'Screen_Protection']
+    _apply_fixes(df, fixes, set(fixes['Column']) - set(derived))
+    df['RAM Type'] = df['RAM Type'].str.upper()
+    df = df.drop(columns=DROPPED_COLUMNS)
+
+    df['Processor_Brand'] = df['Processor_Brand'].replace('Unknown',
+                                                          'Qualcomm')
+    df['Core Configuration'] = df['Processor'].map(
+        corrections.CORE_CONFIGURATIONS).fillna(df['Core Configuration'])
+    df['Series'] = df['Processor'].map(
+        corrections.PROCESSOR_SERIES).fillna(df['Series'])
+    _apply_fixes(df, fixes, ['Core Configuration', 'Series'])
+
+    df['Weight'] = (df['Weight']
+                    .str.replace(r'\s*Kg weight\s*\(.*?\)', '', regex=True)
+                    .str.replace(' Kg weight', '', regex=False)
+                    .astype(float))
+    df = df.rename(columns={'Weight': 'Weight(kg)'})
+    df['Colour(s)'] = (df['Colour(s)'].str.strip().str.title()
+                       .replace(corrections.COLOUR_NAMES)
+                       .replace(corrections.COLOUR_SPELLINGS)
+                       .replace(corrections.COLOUR_GROUPS))
+
+    features = df['Display Features']
+    glare = features.str.contains('|'.join(ANTI_GLARE)).mask(features.isna())
+    df.insert(df.columns.get_loc('Touchscreen') + 1, 'Screen_Protection',
+              glare.map({True: 'Yes', False: 'No'}))
+    _apply_fixes(df, fixes, ['Screen_Protection'])
+
+    graphics = df['Graphics Processor'].str.split().str[0].fillna('Unknown')
+    graphics = graphics.mask(graphics.str.lower().isin(['nvidia', 'nividia']),
+                             'NVIDIA')
+    df.insert(df.columns.get_loc('Graphics Processor') + 1, 'Graphics_Brand',
+              graphics.mask(graphics.str.lower() == 'ati', 'AMD'))
+
+    resolution = df['Display Resolution'].str.extract(r'(\d+) x (\d+)')
+    width = resolution[0].astype('Int64')
+    height = resolution[1].astype('Int64')
+    size = df['Display Size'].str.extract(r'(\d+\.?\d*)',
+                                          expand=False).astype(float)
+    at = df.columns.get_loc('Display Resolution')
+    df.insert(at, 'Display Size (Inches)', size)
+    df.insert(at + 2, 'Resolution Width', width)
+    df.insert(at + 3, 'Resolution Height', height)
+    df.insert(at + 4, 'PPI', (np.sqrt(width.astype(float) ** 2
+                                      + height.astype(float) ** 2)
+                              / size).round(2))
+    df.insert(at + 5, 'Aspect Ratio', (width / height).round(2))
+    df = df.drop(columns=['Display Size', 'Display Resolution', 'Generation',
+                          'Display Features'])
+
+    df['Brand'] = df['Brand'].str.strip().str.title().replace(
+        corrections.BRAND_NAMES)
+    return df
+
+
+def _utility(df):
+    processor = df['Processor']
+    clock = df['Clock-speed']
+    ram = df['Ram_Capacity(GB)']
+    price_range = df['Price_Range']
+    graphics = df['Graphics_Brand']
+    conditions = [
+        (processor.str.contains('i7|Ryzen 7|i9|Ryzen 9') & (clock >= 3.0)
+         & (ram >= 16) & graphics.isin(['NVIDIA', 'AMD'])),
+        ((clock >= 2.0) & (ram >= 8)
+         & price_range.isin(['Premium', 'Luxury'])
+         & df['Core Configuration'].str.contains('Quad Core')),
+        (clock < 2.0) & (ram < 8) & price_range.isin(['Budget', 'Economy']),
+        ((df['Weight(kg)'] < 1.5) & price_range.isin(['Mid-Range', 'Premium'])
+         & (ram >= 8)),
+        (ram >= 32) & graphics.isin(['NVIDIA Quadro', 'AMD FirePro']),
+    ]
+    choices = ['Gaming', 'Business', 'Personal', 'Ultrabook', 'Workstation']
+    return np.select(conditions, choices, default='Everyday Use')
+
+
+def _spec_score(df):
+    processor = df['Processor']
+    tier = np.select([processor.str.contains('i7|Ryzen 7'),
+                      processor.str.contains('i5|Ryzen 5'),
+                      processor.str.contains('i3|Ryzen 3')], [3, 2, 1],
+                     default=0)
+    return (tier + df['Clock-speed'] / 2.0
+            + df['Ram_Capacity(GB)'] / 4.0).round(1)
+
+
+def preprocess(df):
+    """ Reduces the cleaned listings to the columns the analysis reads. """
+    df = df.copy()
+    listings = df['Brand'].value_counts()
+    df['Original_Brand'] = df['Brand']
+    rare = listings[listings < MIN_BRAND_LISTINGS].index
+    df.loc[df['Brand'].isin(rare), 'Brand'] = 'Other'
+
+    df['Model_Name'] = (df['Model_Name'].str.lower().str.strip()
+                        .str.replace(r'[^\w\s]', '', regex=True))
+    df.pop('Series')
+    df.insert(df.columns.get_loc('Model_Name') + 1, 'Series',
+              df['Model_Name'].str.extract(r'^(\w+)', expand=False)
+              .fillna(df['Model_Name']))
+    df.insert(df.columns.get_loc('RAM Type') + 1, 'Ram_Capacity(GB)',
+              df['Capacity'].str.replace(' GB', '').astype(int))
+    df = df.drop(columns=['Spec Score', 'Capacity', 'Name',
+                          'Operating System', 'Graphics Processor'])
+    df['Price_Range'] = df['Price_Range'].map(PRICE_RANGES)
+    df.insert(df.columns.get_loc('Price_Range') + 1, 'Utility',
+              _utility(df))
+    df.insert(df.columns.get_loc('Brand') + 1, 'Spec_Score', _spec_score(df))
+    return df.drop(columns=['Processor'])
 
 
 @click.command()
@@ -12,17 +315,17 @@ def main(input_filepath, output_filepath):
     """ Runs data processing scripts to turn raw data from (../raw) into
         cleaned data ready to be analyzed (saved in ../processed).
     """
-    logger = logging.getLogger(__name__)
     logger.info('making final data set from raw data')
+    df = impute(pd.read_csv(input_filepath))
+    df = preprocess(clean(df, load_fixes()))
+    df.to_csv(output_filepath, index=False)
+    logger.info('wrote %d listings to %s', len(df), output_filepath)
 
 
 if __name__ == '__main__':
     log_fmt = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     logging.basicConfig(level=logging.INFO, format=log_fmt)
 
-    # not used in this stub but often useful for finding various files
-    project_dir = Path(__file__).resolve().parents[2]
-
     # find .env automagically by walking up directories until it's found, then
     # load up the .env entries as environment variables
     load_dotenv(find_dotenv())
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+""" Append-only price history across scrape snapshots.
+
+    Each snapshot is one hive-style partition (snapshot=<label>) of Parquet
+    files under data/processed/price_history. Queries go through
+    pyarrow.dataset, so filters on `snapshot` prune whole partitions and
+    filters on other columns are pushed down to row-group statistics.
+"""
+import logging
+import os
+import shutil
+import uuid
+from pathlib import Path
+
+import click
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from src.data.shared_dataset import dataset_version
+
+PROJECT_DIR = Path(__file__).resolve().parents[2]
+DEFAULT_ROOT = PROJECT_DIR / 'data' / 'processed' / 'price_history'
+COLUMNS = ['Brand', 'Series', 'Model_Name', 'Price', 'Price_Range',
+           'Spec_Score']
+SCHEMA = pa.schema([
+    ('Brand', pa.string()),
+    ('Series', pa.string()),
+    ('Model_Name', pa.string()),
+    ('Price', pa.float64()),
+    ('Price_Range', pa.string()),
+    ('Spec_Score', pa.float64()),
+])
+DICTIONARY_COLUMNS = ['Brand', 'Series', 'Model_Name', 'Price_Range']
+PARTITIONING = ds.partitioning(pa.schema([('snapshot', pa.string())]),
+                               flavor='hive')
+# Parquet metadata key holding the dataset_version of a snapshot's rows.
+VERSION_KEY = b'laptops.dataset_version'
+
+logger = logging.getLogger(__name__)
+
+
+def _partition_dir(root, snapshot):
+    return Path(root) / 'snapshot={}'.format(snapshot)
+
+
+def snapshots(root=DEFAULT_ROOT):
+    """ Snapshot labels in the store, oldest first. Read from the directory
+        names, so no data files are opened.
+    """
+    root = Path(root)
+    if not root.exists():
+        return []
+    return sorted(path.name.split('=', 1)[1] for path in root.iterdir()
+                  if path.is_dir() and path.name.startswith('snapshot='))
+
+
+def _price_frame(df):
+    frame = df[COLUMNS].copy()
+    for column in DICTIONARY_COLUMNS:
+        # Names such as Series '14' may have been parsed as numbers.
+        values = frame[column]
+        frame[column] = values.where(values.isna(), values.astype(str))
+    return frame
+
+
+def snapshot_version(snapshot, root=DEFAULT_ROOT):
+    """ The dataset_version recorded for a snapshot's rows, or None if it
+        was stored without one.
+    """
+    path = _partition_dir(root, snapshot) / 'part-0.parquet'
+    metadata = pq.read_schema(str(path)).metadata or {}
+    version = metadata.get(VERSION_KEY)
+    return version.decode('utf-8') if version else None
+
+
+def latest_snapshot_of(df, root=DEFAULT_ROOT):
+    """ Label of the latest snapshot if it already holds exactly the price
+        columns of `df`, otherwise None.
+    """
+    labels = snapshots(root)
+    if not labels:
+        return None
+    version = dataset_version(_price_frame(df))
+    return labels[-1] if snapshot_version(labels[-1], root) == version \
+        else None
+
+
+def append_snapshot(df, snapshot, root=DEFAULT_ROOT, overwrite=False):
+    """ Writes the price columns of `df` as a new snapshot partition.
+
+        Labels should sort chronologically (e.g. ISO dates). Existing
+        snapshots are never modified unless `overwrite` is set, in which
+        case the partition is replaced as a whole.
+    """
+    partition = _partition_dir(root, snapshot)
+    if partition.exists() and not overwrite:
+        raise ValueError('snapshot {!r} already exists in {}'.format(
+            snapshot, root))
+
+    frame = _price_frame(df)
+    table = pa.Table.from_pandas(frame, schema=SCHEMA, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[VERSION_KEY] = dataset_version(frame).encode('utf-8')
+    table = table.replace_schema_metadata(metadata)
+    staging = Path(root) / '.staging-{}'.format(uuid.uuid4().hex)
+    staging.mkdir(parents=True)
+    try:
+        pq.write_table(table, str(staging / 'part-0.parquet'),
+                       use_dictionary=DICTIONARY_COLUMNS,
+                       compression='zstd', row_group_size=64 * 1024)
+        if partition.exists():
+            shutil.rmtree(partition)
+        # The partition appears in one rename, so readers never see a
+        # half-written snapshot.
+        os.replace(staging, partition)
+    finally:
+        if staging.exists():
+            shutil.rmtree(staging)
+    logger.info('stored snapshot %s (%d rows)', snapshot, table.num_rows)
+    return partition
+
+
+def dataset(root=DEFAULT_ROOT):
+    # Staging directories start with '.', which pyarrow ignores by default.
+    return ds.dataset(str(root), format='parquet', partitioning=PARTITIONING)
+
+
+def series_trajectory(series, brand=None, root=DEFAULT_ROOT):
+    """ Mean, min and max Price of a Series in every snapshot it appears
+        in, oldest first.
+    """
+    condition = pc.field('Series') == series
+    if brand is not None:
+        condition = condition & (pc.field('Brand') == brand)
+    table = dataset(root).to_table(columns=['snapshot', 'Price'],
+                                   filter=condition)
+    grouped = table.group_by('snapshot').aggregate([
+        ('Price', 'mean'), ('Price', 'min'), ('Price', 'max'),
+        ('Price', 'count')])
+    trajectory = grouped.to_pandas().rename(columns={
+        'Price_mean': 'mean_price', 'Price_min': 'min_price',
+        'Price_max': 'max_price', 'Price_count': 'listings'})
+    return trajectory.sort_values('snapshot').reset_index(drop=True)
+
+
+def brand_average_prices(snapshot_labels, root=DEFAULT_ROOT):
+    """ Average Price per Brand (rows) and snapshot (columns), reading only
+        the partitions of the requested snapshots.
+    """
+    table = dataset(root).to_table(
+        columns=['snapshot', 'Brand', 'Price'],
+        filter=pc.field('snapshot').isin(list(snapshot_labels)))
+    grouped = table.group_by(['Brand', 'snapshot']).aggregate(
+        [('Price', 'mean')]).to_pandas()
+    return grouped.pivot(index='Brand', columns='snapshot',
+                         values='Price_mean')
+
+
+def brand_price_moves(start, end, threshold=0.0, root=DEFAULT_ROOT):
+    """ Brands whose average Price changed by more than `threshold` percent
+        between the `start` and `end` snapshots, largest move first.
+    """
+    if start == end:
+        raise ValueError('start and end must be different snapshots, '
+                         'got {!r} twice'.format(start))
+    prices = brand_average_prices([start, end], root).dropna()
+    if start not in prices or end not in prices:
+        return pd.DataFrame(columns=['Brand', start, end, 'change_pct'])
+    moves = prices[[start, end]].copy()
+    moves['change_pct'] = (moves[end] / moves[start] - 1) * 100
+    moves = moves[moves['change_pct'].abs() > threshold]
+    order = moves['change_pct'].abs().sort_values(ascending=False).index
+    return moves.loc[order].reset_index()
+
+
+@click.group()
+def main():
+    """ Manages the snapshot price history store. """
+
+
+@main.command()
+@click.argument('input_filepath', type=click.Path(exists=True))
+@click.argument('snapshot')
+@click.option('--root', type=click.Path(file_okay=False),
+              default=str(DEFAULT_ROOT), show_default=True)
+@click.option('--overwrite', is_flag=True,
+              help='Replace the snapshot if it already exists.')
+def append(input_filepath, snapshot, root, overwrite):
+    """ Adds a processed CSV (e.g. df.csv) as SNAPSHOT. """
+    df = pd.read_csv(input_filepath, usecols=COLUMNS,
+                     dtype={column: str for column in DICTIONARY_COLUMNS})
+    append_snapshot(df, snapshot, root=root, overwrite=overwrite)
+
+
+@main.command()
+@click.argument('start')
+@click.argument('end')
+@click.option('--threshold', default=5.0, show_default=True,
+              help='Minimum absolute change in percent.')
+@click.option('--root', type=click.Path(file_okay=False),
+              default=str(DEFAULT_ROOT), show_default=True)
+def moves(start, end, threshold, root):
+    """ Lists brands whose average Price moved between two snapshots. """
+    try:
+        moved = brand_price_moves(start, end, threshold, root)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint='END')
+    click.echo(moved.to_string(index=False))
+
+
+if __name__ == '__main__':
+    log_fmt = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    logging.basicConfig(level=logging.INFO, format=log_fmt)
+
+    main()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+import csv
+import os
+from pathlib import Path
+
+
+class Checkpoint:
+    """ Append-only record of detail pages whose rows have been written, so
+        an interrupted scrape can pick up where it stopped.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.done = set()
+        if self.path.exists():
+            with open(self.path) as fh:
+                self.done = {line.strip() for line in fh if line.strip()}
+        self._fh = None
+
+    @property
+    def resuming(self):
+        return self.path.exists()
+
+    def open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(self.path, 'a')
+        return self
+
+    def close(self):
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def __contains__(self, url):
+        return url in self.done
+
+    def mark(self, url):
+        self.done.add(url)
+        self._fh.write(url + '\n')
+        self._fh.flush()
+
+    def clear(self):
+        """ Removes the checkpoint once a scrape has finished. """
+        self.close()
+        if self.path.exists():
+            os.remove(self.path)
+        self.done = set()
+
+
+class RowWriter:
+    """ Streams rows into a CSV file as they are scraped, flushing each one
+        so a crash loses at most the row in flight. Appends when resuming,
+        otherwise starts a fresh file with a header.
+    """
+
+    def __init__(self, path, columns, append=False):
+        self.path = Path(path)
+        self.columns = columns
+        self.append = append
+        self.count = 0
+        self._fh = None
+        self._writer = None
+
+    def __enter__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fresh = not (self.append and self.path.exists()
+                     and self.path.stat().st_size)
+        self._fh = open(self.path, 'w' if fresh else 'a', newline='',
+                        encoding='utf-8')
+        self._writer = csv.writer(self._fh)
+        if fresh:
+            self._writer.writerow(self.columns)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._fh.close()
+
+    def write(self, row):
+        self._writer.writerow(row)
+        self._fh.flush()
+        self.count += 1
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import logging
+import random
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+DEFAULT_HEADERS = {
+    'User-Agent': ('Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+                   '(KHTML, like Gecko) Chrome/125.0 Safari/537.36'),
+    'Accept-Language': 'en-IN,en;q=0.9',
+}
+
+
+class FetchError(Exception):
+    """ Raised when a page could not be fetched after all retries.
+        `status` is the HTTP status for non-retryable responses such as 404,
+        and None when the request never got a usable response.
+    """
+
+    def __init__(self, url, reason, status=None):
+        super().__init__('{}: {}'.format(url, reason))
+        self.url = url
+        self.reason = reason
+        self.status = status
+
+
+class HostRateLimiter:
+    """ Spaces requests to the same host at least 1/rate seconds apart.
+        Requests to different hosts do not wait on each other.
+    """
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = {}
+        self._locks = defaultdict(asyncio.Lock)
+
+    async def wait(self, host):
+        if not self.interval:
+            return
+        loop = asyncio.get_running_loop()
+        async with self._locks[host]:
+            now = loop.time()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class Fetcher:
+    """ Pooled HTTP client shared by every listing and detail request.
+
+        Use as an async context manager so the connection pool is closed:
+
+            async with Fetcher(concurrency=8, rate=2.0) as fetcher:
+                html = await fetcher.get(url)
+    """
+
+    def __init__(self, concurrency=8, rate=2.0, retries=4, backoff=1.0,
+                 timeout=30.0, headers=None):
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.headers = dict(DEFAULT_HEADERS, **(headers or {}))
+        self.limiter = HostRateLimiter(rate)
+        self._session = None
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.concurrency,
+                                         limit_per_host=self.concurrency)
+        self._session = aiohttp.ClientSession(connector=connector,
+                                              timeout=self.timeout,
+                                              headers=self.headers)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._session.close()
+        self._session = None
+
+    def _delay(self, attempt, retry_after=None):
+        if retry_after is not None:
+            return retry_after
+        return self.backoff * (2 ** attempt) * (0.5 + random.random())
+
+    async def get(self, url):
+        """ Returns the body of `url` as text, retrying connection errors,
+            timeouts, 429 and 5xx responses with exponential backoff.
+        """
+        host = urlsplit(url).netloc
+        reason = retry_after = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                delay = self._delay(attempt - 1, retry_after)
+                logger.debug('retrying %s in %.1fs (%s)', url, delay, reason)
+                await asyncio.sleep(delay)
+            await self.limiter.wait(host)
+            try:
+                async with self._session.get(url) as response:
+                    if response.status in RETRY_STATUSES:
+                        reason = 'HTTP {}'.format(response.status)
+                        retry_after = _retry_after(response.headers)
+                        continue
+                    if response.status >= 400:
+                        raise FetchError(url, 'HTTP {}'.format(
+                            response.status), status=response.status)
+                    return await response.text()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                reason, retry_after = repr(exc), None
+        raise FetchError(url, 'gave up after {} attempts: {}'.format(
+            self.retries + 1, reason))
+
+
+def _retry_after(headers):
+    try:
+        return float(headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        return None
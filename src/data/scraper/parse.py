@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+""" HTML parsing for 91mobiles laptop finder pages.
+
+    Everything here is a pure function of the page text so it can run in a
+    process pool, away from the event loop that does the fetching.
+"""
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+# Output column -> label of the row in the detail page specification table.
+SPEC_LABELS = {
+    'Processor': 'Processor',
+    'Clock-speed': 'Clock-speed',
+    'Operating System': 'Operating System',
+    'SSD Capacity': 'SSD Capacity',
+    'RAM Type': 'RAM type',
+    'Graphics Processor': 'Graphic Processor',
+    'Display Size': 'Display Size',
+    'Display Resolution': 'Display Resolution',
+    'Capacity': 'Capacity',
+    'Aspect Ratio': 'Aspect Ratio',
+    'Overall Rating': None,
+    'Battery Cell': 'Battery Cell',
+    'Battery type': 'Battery type',
+    'Power Supply': 'Power Supply',
+    'Weight': 'Weight',
+    'Touchscreen': 'Touchscreen',
+    'Colour(s)': 'Colour(s)',
+    'Display Features': 'Display Features',
+}
+COLUMNS = ['Name', 'Price', 'Spec Score'] + list(SPEC_LABELS)
+MISSING = 'N/A'
+
+
+def _text(node):
+    return node.get_text(' ', strip=True) if node is not None else None
+
+
+def parse_listing(html, base_url):
+    """ Returns the laptop cards on a listing page as dicts with Name, Price,
+        Spec Score and the absolute detail page `url`.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    cards = []
+    for card in soup.select('.finder_snipet_wrap'):
+        link = card.select_one('a.hover_blue_link')
+        if link is None or not link.get('href'):
+            continue
+        price = _text(card.select_one('.price')) or MISSING
+        score = _text(card.select_one('.rating_box_new_list'))
+        cards.append({
+            'Name': _text(link),
+            'Price': price.replace('Rs.', '').strip(),
+            'Spec Score': score.replace('%', '').strip() if score else MISSING,
+            'url': urljoin(base_url, link['href']),
+        })
+    return cards
+
+
+def parse_detail(html):
+    """ Returns the specification values of a detail page keyed by output
+        column, with N/A for rows the page does not have.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    table = {}
+    for cell in soup.find_all('td'):
+        label = cell.get_text(strip=True)
+        if label in table:
+            continue
+        value = cell.find_next_sibling('td')
+        if value is not None:
+            table[label] = _text(value)
+
+    specs = {}
+    for column, label in SPEC_LABELS.items():
+        if label is None:
+            rating = _text(soup.select_one('span.ratpt'))
+            specs[column] = rating.split('/')[0].strip() if rating else MISSING
+        else:
+            specs[column] = table.get(label) or MISSING
+    return specs
+
+
+def build_row(card, html):
+    """ Combines a listing card with its parsed detail page into one output
+        row ordered like COLUMNS.
+    """
+    row = dict(card, **parse_detail(html))
+    return [row.get(column, MISSING) for column in COLUMNS]
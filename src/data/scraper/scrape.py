@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+import click
+
+from src.data.scraper.checkpoint import Checkpoint, RowWriter
+from src.data.scraper.fetch import Fetcher, FetchError
+from src.data.scraper.parse import COLUMNS, build_row, parse_listing
+from src.data.scraper.standin import fixture_path
+
+PROJECT_DIR = Path(__file__).resolve().parents[3]
+# The notebook ticked "Available In Stores" in the browser before scraping.
+# This URL carries no filter and lists every laptop in the finder; pass
+# --listing-url with the filtered listing's URL to narrow it.
+LISTING_URL = 'https://www.91mobiles.com/laptopfinder.php?page={page}'
+MAX_LISTING_FAILURES = 3
+
+logger = logging.getLogger(__name__)
+
+
+class Scraper:
+    """ Fetches listing pages in windows of `concurrency` pages and feeds
+        every new card to a pool of detail workers. Fetching happens on the
+        event loop; parsing is handed to a process pool.
+    """
+
+    def __init__(self, fetcher, pool, writer, checkpoint, save_pages=None,
+                 max_listing_failures=MAX_LISTING_FAILURES):
+        self.fetcher = fetcher
+        self.pool = pool
+        self.writer = writer
+        self.checkpoint = checkpoint
+        self.save_pages = save_pages
+        self.max_listing_failures = max_listing_failures
+        self.failed = []
+
+    async def _get(self, url):
+        html = await self.fetcher.get(url)
+        if self.save_pages is not None:
+            path = fixture_path(self.save_pages, url)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(html, encoding='utf-8')
+        return html
+
+    async def _parse(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.pool, func, *args)
+
+    async def _listing(self, url):
+        try:
+            html = await self._get(url)
+        except FetchError as exc:
+            if exc.status == 404:
+                # Asked for a page past the last one.
+                return []
+            logger.warning('listing page failed: %s', exc)
+            self.failed.append(url)
+            return None
+        return await self._parse(parse_listing, html, url)
+
+    async def _detail_worker(self, queue):
+        while True:
+            card = await queue.get()
+            try:
+                html = await self._get(card['url'])
+                row = await self._parse(build_row, card, html)
+                self.writer.write(row)
+                self.checkpoint.mark(card['url'])
+            except Exception as exc:
+                logger.warning('detail page %s failed: %s', card['url'], exc)
+                self.failed.append(card['url'])
+            finally:
+                queue.task_done()
+
+    async def _queue_new(self, cards, queue, listed):
+        """ Queues the cards not listed earlier in this run and not already
+            scraped, and returns how many of them this run had not listed.
+        """
+        new = [card for card in cards if card['url'] not in listed]
+        for card in new:
+            listed.add(card['url'])
+            if card['url'] not in self.checkpoint:
+                await queue.put(card)
+        return len(new)
+
+    async def _consume(self, pages, listings, queue, listed, failures):
+        """ Queues the new cards of one window of listing pages, in page
+            order. Returns whether the listing is finished and the running
+            count of consecutive failed pages.
+        """
+        for n, cards in zip(pages, listings):
+            if cards is None:
+                failures += 1
+                if failures >= self.max_listing_failures:
+                    logger.error('giving up after %d failed listing pages '
+                                 'in a row', failures)
+                    return True, failures
+                continue
+            failures = 0
+            if not cards:
+                return True, failures
+            logger.info('listing page %d: %d laptops', n, len(cards))
+            if not await self._queue_new(cards, queue, listed):
+                # Sites that ignore out-of-range page numbers keep serving
+                # pages already listed; nothing new means the end.
+                return True, failures
+        return False, failures
+
+    async def run(self, listing_url, max_pages=None):
+        """ Scrapes listing pages 1, 2, ... until one comes back empty or
+            404 or lists no laptop not already listed in this run,
+            `max_pages` is reached, or `max_listing_failures` pages in a row
+            fail to load.
+        """
+        window = self.fetcher.concurrency
+        queue = asyncio.Queue(maxsize=window * 4)
+        workers = [asyncio.create_task(self._detail_worker(queue))
+                   for _ in range(window)]
+        # Listed in this run, not from the checkpoint: a resumed run still
+        # walks the pages it scraped before.
+        listed = set()
+        failures = 0
+        try:
+            for pages in _windows(window, max_pages):
+                listings = await asyncio.gather(*(
+                    self._listing(listing_url.format(page=n)) for n in pages))
+                finished, failures = await self._consume(
+                    pages, listings, queue, listed, failures)
+                if finished:
+                    break
+            await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+
+def _windows(size, max_pages=None):
+    """ Consecutive ranges of `size` page numbers starting at 1. """
+    page = 1
+    while max_pages is None or page <= max_pages:
+        last = page + size
+        if max_pages is not None:
+            last = min(last, max_pages + 1)
+        yield range(page, last)
+        page = last
+
+
+async def scrape(output, listing_url=LISTING_URL, checkpoint_path=None,
+                 concurrency=8, rate=2.0, retries=4, workers=None,
+                 max_pages=None, save_pages=None):
+    """ Scrapes laptop listings into `output` and returns the number of rows
+        written. Re-running after an interruption appends only the laptops
+        missing from the checkpoint; a completed run removes it.
+    """
+    output = Path(output)
+    if checkpoint_path is None:
+        checkpoint_path = output.with_name(output.name + '.checkpoint')
+    checkpoint = Checkpoint(checkpoint_path)
+    resuming = checkpoint.resuming
+    if resuming:
+        logger.info('resuming: %d laptops already scraped',
+                    len(checkpoint.done))
+
+    checkpoint.open()
+    try:
+        # Spawned, not forked: forking a process that has threads running
+        # can deadlock the children.
+        with ProcessPoolExecutor(workers,
+                                 mp_context=get_context('spawn')) as pool, \
+                RowWriter(output, COLUMNS, append=resuming) as writer:
+            async with Fetcher(concurrency=concurrency, rate=rate,
+                               retries=retries) as fetcher:
+                scraper = Scraper(fetcher, pool, writer, checkpoint,
+                                  save_pages=save_pages)
+                await scraper.run(listing_url, max_pages=max_pages)
+    finally:
+        checkpoint.close()
+
+    if scraper.failed:
+        logger.warning('%d pages failed; re-run to retry them',
+                       len(scraper.failed))
+    else:
+        checkpoint.clear()
+    return writer.count
+
+
+@click.command()
+@click.argument('output_filepath', type=click.Path(),
+                default=str(PROJECT_DIR / 'data' / 'raw' /
+                            'laptops_data.csv'))
+@click.option('--listing-url', default=LISTING_URL, show_default=True,
+              help='Listing page URL template with a {page} placeholder.')
+@click.option('--concurrency', default=8, show_default=True,
+              help='Concurrent requests and detail workers.')
+@click.option('--rate', default=2.0, show_default=True,
+              help='Maximum requests per second to each host.')
+@click.option('--retries', default=4, show_default=True)
+@click.option('--workers', type=int, default=None,
+              help='Parser processes (defaults to the CPU count).')
+@click.option('--max-pages', type=int, default=None)
+@click.option('--save-pages', type=click.Path(file_okay=False),
+              default=None,
+              help='Also save every fetched page here as a fixture.')
+def main(output_filepath, listing_url, concurrency, rate, retries, workers,
+         max_pages, save_pages):
+    """ Scrapes the 91mobiles laptop finder into data/raw. """
+    start = time.perf_counter()
+    count = asyncio.run(scrape(
+        output_filepath, listing_url=listing_url, concurrency=concurrency,
+        rate=rate, retries=retries, workers=workers, max_pages=max_pages,
+        save_pages=save_pages))
+    logger.info('wrote %d laptops to %s in %.1fs', count, output_filepath,
+                time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    log_fmt = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    logging.basicConfig(level=logging.INFO, format=log_fmt)
+
+    main()
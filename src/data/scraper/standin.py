@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+""" Local HTTP stand-in for 91mobiles that serves saved fixture pages.
+
+    Pages saved with `--save-pages` are named after their path and query, so
+    pointing the scraper at this server replays a recorded scrape offline.
+"""
+import logging
+import threading
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import quote, urlsplit
+
+import click
+
+ORIGIN = 'https://www.91mobiles.com'
+
+logger = logging.getLogger(__name__)
+
+
+def fixture_path(directory, url):
+    """ Maps a URL to the fixture file that stores its page. """
+    parts = urlsplit(url)
+    target = parts.path + ('?' + parts.query if parts.query else '')
+    return Path(directory) / (quote(target, safe='') + '.html')
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+
+    def __init__(self, *args, directory, origin, **kwargs):
+        self.directory = directory
+        self.origin = origin
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self):
+        path = fixture_path(self.directory, self.path)
+        if not path.exists():
+            self.send_error(404)
+            return
+        own = 'http://{}:{}'.format(*self.server.server_address[:2])
+        body = path.read_text(encoding='utf-8').replace(self.origin, own)
+        payload = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        logger.debug(format, *args)
+
+
+def serve(directory, host='127.0.0.1', port=0, origin=ORIGIN):
+    """ Starts the stand-in on a background thread and returns the server;
+        its base URL is `http://host:server.server_port`. Links to `origin`
+        inside served pages are rewritten to point back at the stand-in.
+    """
+    handler = partial(FixtureHandler, directory=Path(directory),
+                      origin=origin)
+    server = ThreadingHTTPServer((host, port), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+@click.command()
+@click.argument('directory', type=click.Path(exists=True, file_okay=False))
+@click.option('--port', default=8000, show_default=True)
+@click.option('--origin', default=ORIGIN, show_default=True,
+              help='Site whose absolute links are rewritten to the stand-in.')
+def main(directory, port, origin):
+    """ Serves saved fixture pages from DIRECTORY until interrupted. """
+    server = serve(directory, port=port, origin=origin)
+    click.echo('serving {} on http://127.0.0.1:{}'.format(
+        directory, server.server_port))
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
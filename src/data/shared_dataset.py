@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import logging
+import os
+import uuid
+from pathlib import Path
+
+import click
+import pandas as pd
+import pyarrow as pa
+
+PROJECT_DIR = Path(__file__).resolve().parents[2]
+DEFAULT_STORE = PROJECT_DIR / 'data' / 'processed' / 'shared'
+STORE_ENV_VAR = 'LAPTOP_DATASET_STORE'
+POINTER_NAME = 'CURRENT'
+
+logger = logging.getLogger(__name__)
+
+
+def store_dir(path=None):
+    """ Resolves the shared dataset store: explicit path, then the
+        LAPTOP_DATASET_STORE environment variable, then data/processed/shared.
+    """
+    if path is None:
+        path = os.environ.get(STORE_ENV_VAR, DEFAULT_STORE)
+    return Path(path)
+
+
+def _dataset_path(store, version):
+    return store / 'laptops-{}.arrow'.format(version)
+
+
+def dataset_version(df):
+    """ Content hash of a frame, independent of how it was loaded. """
+    hashed = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    digest = hashlib.sha256(hashed.tobytes())
+    digest.update(','.join(map(str, df.columns)).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def _atomic_write_text(path, text):
+    tmp_path = path.with_name('.{}.{}.tmp'.format(path.name, uuid.uuid4().hex))
+    with open(tmp_path, 'w') as fh:
+        fh.write(text)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp_path, path)
+
+
+def current_version(store=None):
+    """ Returns the published dataset version, or None if nothing has been
+        published to the store yet.
+    """
+    pointer = store_dir(store) / POINTER_NAME
+    try:
+        return pointer.read_text().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def publish(df, store=None, keep=2):
+    """ Writes `df` as an Arrow IPC file into the store and atomically points
+        CURRENT at it. Readers that already attached keep their mapping; new
+        readers pick up the new version. Returns the version string, which
+        is `dataset_version(df)`.
+    """
+    store = store_dir(store)
+    store.mkdir(parents=True, exist_ok=True)
+
+    version = dataset_version(df)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    tmp_path = store / '.{}.arrow.tmp'.format(uuid.uuid4().hex)
+    with pa.OSFile(str(tmp_path), 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+    os.replace(tmp_path, _dataset_path(store, version))
+    _atomic_write_text(store / POINTER_NAME, version)
+    logger.info('published dataset version %s (%d rows)', version,
+                table.num_rows)
+
+    _prune(store, keep=keep, current=version)
+    return version
+
+
+def _prune(store, keep, current):
+    """ Removes all but the `keep` most recent versions. Processes that still
+        map an unlinked file keep reading it until they re-attach.
+    """
+    published = sorted(store.glob('laptops-*.arrow'),
+                       key=lambda p: p.stat().st_mtime, reverse=True)
+    stale = [p for p in published
+             if p != _dataset_path(store, current)][max(keep - 1, 0):]
+    for path in stale:
+        try:
+            path.unlink()
+        except OSError:
+            # Still mapped by a reader on a platform that forbids unlinking
+            # open files; the next publish will try again.
+            logger.debug('could not remove %s', path)
+
+
+def attach(store=None, version=None):
+    """ Memory-maps a published version (CURRENT by default) and returns it
+        as a pyarrow Table. The buffers point straight into the page cache,
+        so every process attached to the same version shares one copy.
+    """
+    store = store_dir(store)
+    if version is None:
+        version = current_version(store)
+    if version is None:
+        raise FileNotFoundError(
+            'no dataset has been published to {}'.format(store))
+    source = pa.memory_map(str(_dataset_path(store, version)), 'r')
+    return pa.ipc.open_file(source).read_all()
+
+
+def _types_mapper(arrow_type):
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return pd.StringDtype('pyarrow')
+    return None
+
+
+def read_dataframe(store=None, version=None):
+    """ Attaches to a published version and wraps it in a DataFrame without
+        copying: string columns stay Arrow-backed and numeric columns are
+        split into their own blocks so pandas does not consolidate them.
+        The resulting frame is read-only.
+    """
+    table = attach(store, version)
+    return table.to_pandas(split_blocks=True, types_mapper=_types_mapper)
+
+
+@click.command()
+@click.argument('input_filepath', type=click.Path(exists=True))
+@click.argument('store', type=click.Path(), required=False)
+@click.option('--keep', default=2, show_default=True,
+              help='Number of published versions to retain.')
+def main(input_filepath, store, keep):
+    """ Publishes a processed CSV (e.g. df.csv) into the shared dataset store
+        so dashboard and prediction processes can attach to it.
+    """
+    df = pd.read_csv(input_filepath)
+    version = publish(df, store, keep=keep)
+    click.echo(version)
+
+
+if __name__ == '__main__':
+    log_fmt = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    logging.basicConfig(level=logging.INFO, format=log_fmt)
+
+    main()
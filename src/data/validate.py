@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+import json
+import logging
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+import click
+import numpy as np
+import pandas as pd
+
+PROJECT_DIR = Path(__file__).resolve().parents[2]
+
+logger = logging.getLogger(__name__)
+
+
+class Rule:
+    """ A check evaluated on one chunk of rows at a time.
+
+        Subclasses implement `violations(chunk)`, returning a boolean Series
+        aligned with the chunk that is True for every failing row.
+    """
+    severity = 'error'
+
+    def __init__(self, name, columns, severity=None):
+        self.name = name
+        self.columns = list(columns)
+        if severity is not None:
+            self.severity = severity
+
+    def violations(self, chunk):
+        raise NotImplementedError
+
+
+class AllowedValues(Rule):
+
+    def __init__(self, column, values, **kwargs):
+        super().__init__('{} in allowed values'.format(column), [column],
+                         **kwargs)
+        self.column = column
+        self.values = list(values)
+
+    def violations(self, chunk):
+        return ~chunk[self.column].isin(self.values)
+
+
+class InRange(Rule):
+    """ Flags values outside [low, high]; missing values also fail. """
+
+    def __init__(self, column, low, high, **kwargs):
+        super().__init__('{} in [{}, {}]'.format(column, low, high),
+                         [column], **kwargs)
+        self.column = column
+        self.low = low
+        self.high = high
+
+    def violations(self, chunk):
+        return ~chunk[self.column].between(self.low, self.high)
+
+
+class PpiConsistent(Rule):
+    """ PPI must match the diagonal pixel count over the display size to
+        within `tolerance` (relative).
+    """
+
+    def __init__(self, width='Resolution Width', height='Resolution Height',
+                 size='Display Size (Inches)', ppi='PPI', tolerance=0.01,
+                 **kwargs):
+        super().__init__('PPI consistent with resolution and display size',
+                         [width, height, size, ppi], **kwargs)
+        self.width, self.height, self.size, self.ppi = self.columns
+        self.tolerance = tolerance
+
+    def violations(self, chunk):
+        expected = np.hypot(chunk[self.width], chunk[self.height]) \
+            / chunk[self.size]
+        error = (expected - chunk[self.ppi]).abs()
+        return ~(error <= self.tolerance * chunk[self.ppi])
+
+
+class Unique(Rule):
+    """ Uniqueness spans chunks, so each chunk only contributes its keys and
+        duplicates are found once all chunks are in.
+    """
+
+    def __init__(self, column, **kwargs):
+        super().__init__('{} is unique'.format(column), [column], **kwargs)
+        self.column = column
+
+    def violations(self, keys):
+        return keys.duplicated(keep=False)
+
+
+# Schema of the processed dataset (df.csv).
+PROCESSED_RULES = [
+    AllowedValues('Brand', ['Acer', 'Apple', 'Asus', 'Dell', 'HP',
+                            'Infinix', 'Lenovo', 'MSI', 'Microsoft',
+                            'Samsung', 'Other']),
+    AllowedValues('Price_Range', ['Budget', 'Economy', 'Mid-Range',
+                                  'Premium', 'Luxury']),
+    AllowedValues('OS Type', ['Windows', 'Dos', 'Macos', 'Chrome', 'Linux',
+                              'Prime', 'Jio']),
+    AllowedValues('Touchscreen', ['Yes', 'No']),
+    InRange('Price', 5000, 1000000),
+    InRange('PPI', 50, 500),
+    InRange('Weight(kg)', 0.3, 6.0),
+    # The same model is listed once per configuration, so repeats are
+    # reported without failing the run.
+    Unique('Model_Name', severity='warning'),
+    PpiConsistent(),
+]
+
+
+def _row_rules(rules):
+    return [rule for rule in rules if not isinstance(rule, Unique)]
+
+
+def _check_chunk(chunk, rules, sample_size):
+    """ Evaluates the row-level rules on one chunk and returns, per rule,
+        the violation count and the first few failing row numbers, plus the
+        keys needed by cross-chunk rules.
+    """
+    results = []
+    for rule in _row_rules(rules):
+        mask = rule.violations(chunk).to_numpy()
+        failing = chunk.index[mask]
+        results.append((int(mask.sum()), failing[:sample_size].tolist()))
+    keys = [chunk[rule.column] for rule in rules if isinstance(rule, Unique)]
+    return len(chunk), results, keys
+
+
+def _check_chunk_star(args):
+    return _check_chunk(*args)
+
+
+class Report:
+    """ Compact summary of a validation run: one line per rule. """
+
+    def __init__(self, rules, rows):
+        self.rows = rows
+        self.entries = [{'rule': rule.name, 'severity': rule.severity,
+                         'violations': 0, 'sample_rows': []}
+                        for rule in rules]
+
+    @property
+    def errors(self):
+        return sum(entry['violations'] for entry in self.entries
+                   if entry['severity'] == 'error')
+
+    @property
+    def ok(self):
+        return self.errors == 0
+
+    def to_frame(self):
+        return pd.DataFrame(self.entries)
+
+    def to_json(self):
+        return json.dumps({'rows': self.rows, 'rules': self.entries},
+                          indent=2)
+
+    def __str__(self):
+        lines = ['{} rows checked'.format(self.rows)]
+        for entry in self.entries:
+            status = 'ok' if not entry['violations'] else entry['severity']
+            line = '{:<8} {:<52} {:>7}'.format(
+                status, entry['rule'], entry['violations'])
+            if entry['sample_rows']:
+                line += '  rows {}'.format(
+                    ', '.join(map(str, entry['sample_rows'])))
+            lines.append(line)
+        return '\n'.join(lines)
+
+
+def _chunks(source, columns, chunksize):
+    if isinstance(source, pd.DataFrame):
+        frame = source[columns]
+        for start in range(0, len(frame), chunksize):
+            yield frame.iloc[start:start + chunksize]
+    else:
+        yield from pd.read_csv(source, usecols=columns, chunksize=chunksize)
+
+
+def _outcomes(tasks, workers):
+    """ Checks tasks in order, with `workers` processes when more than one.
+        At most two chunks per worker are read ahead of the results, so
+        memory stays bounded by the chunk size on large inputs.
+    """
+    if workers <= 1:
+        yield from map(_check_chunk_star, tasks)
+        return
+    # Spawned, not forked, as validate() may run on a pipeline thread.
+    context = get_context('spawn')
+    with ProcessPoolExecutor(workers, mp_context=context) as pool:
+        pending = deque()
+        for task in tasks:
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+            pending.append(pool.submit(_check_chunk_star, task))
+        while pending:
+            yield pending.popleft().result()
+
+
+def validate(source, rules=PROCESSED_RULES, chunksize=100000, workers=1,
+             sample_size=5):
+    """ Validates a DataFrame or CSV path against `rules` and returns a
+        Report. Only the columns the rules need are read, chunk by chunk;
+        with `workers` > 1 chunks are checked in a process pool.
+    """
+    columns = list(dict.fromkeys(c for rule in rules for c in rule.columns))
+    chunks = _chunks(source, columns, chunksize)
+    tasks = ((chunk, rules, sample_size) for chunk in chunks)
+
+    row_rules = _row_rules(rules)
+    unique_rules = [rule for rule in rules if isinstance(rule, Unique)]
+    report = Report(row_rules + unique_rules, 0)
+    key_parts = [[] for _ in unique_rules]
+    for rows, results, keys in _outcomes(tasks, workers):
+        report.rows += rows
+        for entry, (count, sample) in zip(report.entries, results):
+            entry['violations'] += count
+            room = sample_size - len(entry['sample_rows'])
+            entry['sample_rows'].extend(sample[:room])
+        for parts, key in zip(key_parts, keys):
+            parts.append(key)
+
+    entries = report.entries[len(row_rules):]
+    for entry, rule, parts in zip(entries, unique_rules, key_parts):
+        keys = pd.concat(parts) if parts else pd.Series(dtype=object)
+        failing = keys.index[rule.violations(keys).to_numpy()]
+        entry['violations'] = len(failing)
+        entry['sample_rows'] = failing[:sample_size].tolist()
+    return report
+
+
+@click.command()
+@click.argument('input_filepath', type=click.Path(exists=True),
+                default=str(PROJECT_DIR / 'df.csv'))
+@click.option('--chunksize', default=100000, show_default=True)
+@click.option('--workers', default=1, show_default=True,
+              help='Processes used to check chunks in parallel.')
+@click.option('--json', 'as_json', is_flag=True,
+              help='Print the report as JSON.')
+def main(input_filepath, chunksize, workers, as_json):
+    """ Validates a processed dataset and exits non-zero on any error. """
+    report = validate(input_filepath, chunksize=chunksize, workers=workers)
+    click.echo(report.to_json() if as_json else str(report))
+    if not report.ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    log_fmt = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    logging.basicConfig(level=logging.INFO, format=log_fmt)
+
+    main()
@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+""" Mergeable running moment sums for correlation analysis.
+
+    Pearson correlations only need, for every pair of columns, the number
+    of rows where both are present and the sums, squared sums and
+    cross-products over those rows. Those sums add up across batches, so
+    new rows are folded in without revisiting old ones and per-chunk or
+    per-process results merge by addition.
+"""
+import hashlib
+import json
+import logging
+import os
+import uuid
+from pathlib import Path
+
+import click
+import numpy as np
+import pandas as pd
+
+from src.data.shared_dataset import dataset_version
+
+PROJECT_DIR = Path(__file__).resolve().parents[2]
+DEFAULT_STATE = PROJECT_DIR / 'data' / 'processed' / 'moments.npz'
+NUMERIC_COLUMNS = ['Price', 'Spec_Score', 'Ram_Capacity(GB)', 'Clock-speed',
+                   'PPI', 'Weight(kg)', 'Display Size (Inches)',
+                   'Resolution Width', 'Resolution Height', 'Aspect Ratio']
+# Trailing rows of the last ingest whose hash marks where the sums end.
+BOUNDARY_ROWS = 64
+
+logger = logging.getLogger(__name__)
+
+
+class MomentSums:
+    """ Pairwise-complete count, sums, squared sums and cross-products.
+
+        Entry [i, j] of each matrix covers the rows where both column i and
+        column j are present, matching DataFrame.corr() on missing values.
+    """
+
+    def __init__(self, columns=NUMERIC_COLUMNS):
+        self.columns = list(columns)
+        k = len(self.columns)
+        self.n = np.zeros((k, k))
+        self.sx = np.zeros((k, k))
+        self.sxx = np.zeros((k, k))
+        self.sxy = np.zeros((k, k))
+
+    @property
+    def rows(self):
+        return int(self.n.diagonal().max()) if len(self.columns) else 0
+
+    def update(self, frame):
+        """ Folds the rows of `frame` into the sums. """
+        values = frame[self.columns].to_numpy(dtype=float)
+        present = ~np.isnan(values)
+        filled = np.where(present, values, 0.0)
+        mask = present.astype(float)
+        self.n += mask.T @ mask
+        self.sx += filled.T @ mask
+        self.sxx += (filled * filled).T @ mask
+        self.sxy += filled.T @ filled
+        return self
+
+    def merge(self, other):
+        if other.columns != self.columns:
+            raise ValueError('cannot merge moments over different columns')
+        self.n += other.n
+        self.sx += other.sx
+        self.sxx += other.sxx
+        self.sxy += other.sxy
+        return self
+
+    def correlation(self, min_periods=2):
+        """ Pearson correlation matrix as a DataFrame; pairs with fewer than
+            `min_periods` rows or zero variance are NaN.
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            n = np.where(self.n >= min_periods, self.n, np.nan)
+            mean_x = self.sx / n
+            mean_y = self.sx.T / n
+            cov = self.sxy / n - mean_x * mean_y
+            var_x = self.sxx / n - mean_x ** 2
+            var_y = self.sxx.T / n - mean_y ** 2
+            corr = cov / np.sqrt(var_x * var_y)
+        corr = np.clip(corr, -1.0, 1.0)
+        np.fill_diagonal(corr, np.where(np.isnan(corr.diagonal()), np.nan,
+                                        1.0))
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+    def to_arrays(self, prefix=''):
+        return {prefix + name: getattr(self, name)
+                for name in ('n', 'sx', 'sxx', 'sxy')}
+
+    @classmethod
+    def from_arrays(cls, columns, arrays, prefix=''):
+        moments = cls(columns)
+        for name in ('n', 'sx', 'sxx', 'sxy'):
+            setattr(moments, name, np.array(arrays[prefix + name]))
+        return moments
+
+
+class MomentStore:
+    """ Overall and per-Brand moment sums, persisted between ingests along
+        with the version of the dataset they describe.
+
+        The store also records how many rows it covers and a hash of the
+        last few of them, so a later frame can be checked cheaply for
+        whether it continues the rows already ingested.
+    """
+
+    def __init__(self, columns=NUMERIC_COLUMNS, group_by='Brand'):
+        self.columns = list(columns)
+        self.group_by = group_by
+        self.overall = MomentSums(self.columns)
+        self.groups = {}
+        self.rows = 0
+        self.boundary = None
+        self.boundary_rows = 0
+        self.version = None
+
+    @classmethod
+    def from_frame(cls, frame, version=None, chunksize=None, **kwargs):
+        """ Builds the sums from a whole frame, optionally chunk by chunk. """
+        store = cls(**kwargs)
+        chunksize = chunksize or max(len(frame), 1)
+        for start in range(0, len(frame), chunksize):
+            store.ingest(frame.iloc[start:start + chunksize])
+        store.version = version
+        return store
+
+    def ingest(self, frame, version=None):
+        """ Folds newly ingested rows into the overall and per-group sums.
+            `version` names the dataset the sums describe afterwards; None
+            means unknown.
+        """
+        self.overall.update(frame)
+        for key, rows in frame.groupby(self.group_by, sort=False):
+            group = self.groups.setdefault(str(key), MomentSums(self.columns))
+            group.update(rows)
+        self.rows += len(frame)
+        if len(frame):
+            self.boundary_rows = min(BOUNDARY_ROWS, len(frame))
+            self.boundary = self._hash_rows(frame.iloc[-self.boundary_rows:])
+        self.version = version
+        return self
+
+    def _hash_rows(self, rows):
+        # Hashes the values as floats and strings, so the same rows match
+        # whether they came from read_csv or an Arrow-backed frame.
+        digest = hashlib.sha256(
+            rows[self.columns].to_numpy(dtype=float).tobytes())
+        digest.update('\0'.join(rows[self.group_by].astype(str)).encode(
+            'utf-8'))
+        return digest.hexdigest()[:16]
+
+    def continued_by(self, frame):
+        """ Whether `frame` starts with the rows ingested so far: it is at
+            least as long and its rows at the recorded boundary hash the
+            same. Only the boundary rows are compared, so edits further
+            back are not detected.
+        """
+        if self.boundary is None or not 0 < self.rows <= len(frame):
+            return False
+        rows = frame.iloc[self.rows - self.boundary_rows:self.rows]
+        return self._hash_rows(rows) == self.boundary
+
+    def merge(self, other):
+        """ Adds the sums of `other`, which covers the rows after these. """
+        self.rows += other.rows
+        if other.boundary is not None:
+            self.boundary = other.boundary
+            self.boundary_rows = other.boundary_rows
+        self.overall.merge(other.overall)
+        for key, moments in other.groups.items():
+            if key in self.groups:
+                self.groups[key].merge(moments)
+            else:
+                self.groups[key] = moments
+        return self
+
+    def correlation(self, group=None, min_periods=2):
+        moments = self.overall if group is None else self.groups[group]
+        return moments.correlation(min_periods=min_periods)
+
+    def save(self, path=DEFAULT_STATE):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        groups = sorted(self.groups)
+        arrays = self.overall.to_arrays('overall.')
+        for index, key in enumerate(groups):
+            arrays.update(self.groups[key].to_arrays('group{}.'.format(index)))
+        meta = {'columns': self.columns, 'group_by': self.group_by,
+                'groups': groups, 'rows': self.rows,
+                'boundary': self.boundary,
+                'boundary_rows': self.boundary_rows,
+                'version': self.version}
+        # Unique per writer: dashboard processes may save concurrently.
+        tmp_path = path.with_name('.{}.{}'.format(path.name,
+                                                  uuid.uuid4().hex))
+        with open(tmp_path, 'wb') as fh:
+            np.savez(fh, meta=np.array(json.dumps(meta)), **arrays)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path=DEFAULT_STATE):
+        """ Loads saved sums, or returns an empty store if none exist. """
+        try:
+            arrays = np.load(path)
+        except FileNotFoundError:
+            return cls()
+        with arrays:
+            meta = json.loads(str(arrays['meta']))
+            store = cls(meta['columns'], meta['group_by'])
+            store.overall = MomentSums.from_arrays(store.columns, arrays,
+                                                   'overall.')
+            for index, key in enumerate(meta['groups']):
+                store.groups[key] = MomentSums.from_arrays(
+                    store.columns, arrays, 'group{}.'.format(index))
+            store.rows = meta.get('rows', store.overall.rows)
+            store.boundary = meta.get('boundary')
+            store.boundary_rows = meta.get('boundary_rows', 0)
+            store.version = meta['version']
+        return store
+
+
+def catch_up(store, frame, version=None):
+    """ Returns sums covering every row of `frame`, labelled `version`.
+
+        When `frame` continues the rows `store` already covers, as after a
+        scrape that appended laptops, only the rows after them are ingested
+        into `store`. Otherwise, for example when rows were removed or
+        reordered, the sums are rebuilt. Passing the frame's known version
+        skips the check when the store already describes it.
+    """
+    if version is not None and store.version == version:
+        return store
+    if store.continued_by(frame):
+        new = frame.iloc[store.rows:]
+        logger.info('ingesting %d new rows', len(new))
+        return store.ingest(new, version=version)
+    logger.info('rebuilding moments from %d rows', len(frame))
+    return MomentStore.from_frame(frame, version=version,
+                                  columns=store.columns,
+                                  group_by=store.group_by)
+
+
+def _read(input_filepath):
+    return pd.read_csv(input_filepath,
+                       usecols=NUMERIC_COLUMNS + ['Brand'])
+
+
+@click.group()
+def main():
+    """ Maintains the running moment sums behind the correlation page. """
+
+
+@main.command()
+@click.argument('input_filepath', type=click.Path(exists=True))
+@click.option('--version', default=None,
+              help='Dataset version the sums describe after this ingest; '
+                   'left unknown if not given.')
+@click.option('--state', type=click.Path(dir_okay=False),
+              default=str(DEFAULT_STATE), show_default=True)
+def ingest(input_filepath, version, state):
+    """ Folds the new rows in INPUT_FILEPATH into the saved sums. """
+    store = MomentStore.load(state)
+    store.ingest(_read(input_filepath), version=version)
+    store.save(state)
+    logger.info('moments now cover %d rows', store.overall.rows)
+
+
+@main.command()
+@click.argument('input_filepath', type=click.Path(exists=True))
+@click.option('--version', default=None,
+              help='Dataset version the sums describe (defaults to the '
+                   'content hash of INPUT_FILEPATH).')
+@click.option('--state', type=click.Path(dir_okay=False),
+              default=str(DEFAULT_STATE), show_default=True)
+def rebuild(input_filepath, version, state):
+    """ Recomputes the saved sums from a full dataset. """
+    df = pd.read_csv(input_filepath)
+    if version is None:
+        version = dataset_version(df)
+    store = MomentStore.from_frame(df, version=version)
+    store.save(state)
+    logger.info('moments rebuilt from %d rows', store.overall.rows)
+
+
+if __name__ == '__main__':
+    log_fmt = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    logging.basicConfig(level=logging.INFO, format=log_fmt)
+
+    main()
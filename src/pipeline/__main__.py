@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+import logging
+
+from src.pipeline.stages import main
+
+if __name__ == '__main__':
+    log_fmt = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    logging.basicConfig(level=logging.INFO, format=log_fmt)
+
+    main()
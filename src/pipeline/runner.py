@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+""" A small memoized DAG runner.
+
+    A stage declares the files it reads and writes and the code it runs.
+    Its fingerprint hashes that code, its parameters and the contents of its
+    inputs; a stage whose fingerprint matches the last successful run and
+    whose outputs still exist is skipped. Because inputs are hashed by
+    content, a stage that re-runs but writes identical outputs does not
+    invalidate the stages after it.
+"""
+import hashlib
+import inspect
+import json
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class Stage:
+    """ One step of the pipeline.
+
+        `func` is called with `params` as keyword arguments. `inputs` and
+        `outputs` are files or directories relative to the project root;
+        `code` lists extra modules whose source counts as part of the stage,
+        for stages that are thin wrappers around a library module.
+    """
+
+    def __init__(self, name, func, inputs=(), outputs=(), deps=(), code=(),
+                 params=None):
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.deps = list(deps)
+        self.code = list(code)
+        self.params = dict(params or {})
+
+    def code_digest(self):
+        digest = hashlib.sha256(inspect.getsource(self.func).encode('utf-8'))
+        for module in self.code:
+            digest.update(inspect.getsource(module).encode('utf-8'))
+        return digest.hexdigest()
+
+
+class FileDigests:
+    """ Content hashes of files, reused while size and mtime are unchanged
+        so unchanged inputs are not re-read on every run.
+    """
+
+    def __init__(self, entries=None):
+        self.entries = dict(entries or {})
+
+    def file(self, path):
+        stat = path.stat()
+        key = str(path)
+        stamp = [stat.st_size, stat.st_mtime_ns]
+        cached = self.entries.get(key)
+        if cached and cached['stamp'] == stamp:
+            return cached['digest']
+        digest = hashlib.sha256()
+        with open(path, 'rb') as fh:
+            for chunk in iter(lambda: fh.read(1 << 20), b''):
+                digest.update(chunk)
+        self.entries[key] = {'stamp': stamp, 'digest': digest.hexdigest()}
+        return digest.hexdigest()
+
+    def path(self, path):
+        """ Digest of a file, or of every file under a directory. """
+        if not path.exists():
+            return None
+        if path.is_file():
+            return self.file(path)
+        digest = hashlib.sha256()
+        for child in sorted(p for p in path.rglob('*') if p.is_file()):
+            digest.update(str(child.relative_to(path)).encode('utf-8'))
+            digest.update(self.file(child).encode('utf-8'))
+        return digest.hexdigest()
+
+
+class StageFailed(Exception):
+    """ Raised after a run in which one or more stages failed. """
+
+
+class Pipeline:
+    """ Runs stages in dependency order, independent stages in parallel,
+        and records fingerprints and timings in `state_path`.
+    """
+
+    def __init__(self, stages, root, state_path, workers=4):
+        self.stages = {stage.name: stage for stage in stages}
+        self.root = Path(root)
+        self.state_path = Path(state_path)
+        self.workers = workers
+        self.timings = {}
+        for stage in stages:
+            missing = [dep for dep in stage.deps if dep not in self.stages]
+            if missing:
+                raise ValueError('stage {} depends on unknown {}'.format(
+                    stage.name, ', '.join(missing)))
+
+    def _load_state(self):
+        try:
+            with open(self.state_path) as fh:
+                return json.load(fh)
+        except (FileNotFoundError, ValueError):
+            return {'stages': {}, 'files': {}}
+
+    def _save_state(self, state):
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_name(self.state_path.name + '.tmp')
+        with open(tmp_path, 'w') as fh:
+            json.dump(state, fh, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.state_path)
+
+    def history(self):
+        """ The last successful run of each stage: fingerprint, duration
+            in seconds and finish time.
+        """
+        return self._load_state()['stages']
+
+    def selected(self, targets=None):
+        """ Names of the target stages and everything they depend on. """
+        if not targets:
+            return list(self.stages)
+        selected, pending = set(), list(targets)
+        while pending:
+            name = pending.pop()
+            if name not in self.stages:
+                raise KeyError('unknown stage {}'.format(name))
+            if name not in selected:
+                selected.add(name)
+                pending.extend(self.stages[name].deps)
+        return [name for name in self.stages if name in selected]
+
+    def fingerprint(self, stage, digests):
+        inputs = {}
+        for path in stage.inputs:
+            digest = digests.path(self.root / path)
+            if digest is None:
+                raise FileNotFoundError(
+                    'stage {} is missing input {}'.format(stage.name, path))
+            inputs[path] = digest
+        payload = json.dumps({'code': stage.code_digest(),
+                              'params': stage.params, 'inputs': inputs},
+                             sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _is_fresh(self, stage, fingerprint, state):
+        record = state['stages'].get(stage.name)
+        return (record is not None
+                and record.get('fingerprint') == fingerprint
+                and all((self.root / path).exists()
+                        for path in stage.outputs))
+
+    def _execute(self, stage):
+        start = time.perf_counter()
+        stage.func(**stage.params)
+        return time.perf_counter() - start
+
+    def _submit_ready(self, remaining, run):
+        """ Starts every remaining stage whose dependencies have finished and
+            marks those behind a failed dependency as blocked. Returns
+            whether any stage left `remaining`.
+        """
+        progressed = False
+        for name in list(remaining):
+            deps = [dep for dep in self.stages[name].deps if dep in run.names]
+            if any(run.status.get(dep) in ('failed', 'blocked')
+                   for dep in deps):
+                run.status[name] = 'blocked'
+            elif all(dep in run.status for dep in deps):
+                self._submit(name, run)
+            else:
+                continue
+            remaining.remove(name)
+            progressed = True
+        return progressed
+
+    def _submit(self, name, run):
+        stage = self.stages[name]
+        try:
+            fingerprint = self.fingerprint(stage, run.digests)
+        except FileNotFoundError as exc:
+            logger.error('%s: %s', name, exc)
+            run.status[name] = 'failed'
+            return
+        if name not in run.force and \
+                self._is_fresh(stage, fingerprint, run.state):
+            run.status[name] = 'skipped'
+            logger.info('%s: up to date', name)
+            return
+        logger.info('%s: running', name)
+        future = run.pool.submit(self._execute, stage)
+        run.running[future] = (name, fingerprint)
+
+    def _collect_finished(self, run):
+        """ Waits for at least one running stage and records the outcome of
+            every stage that has finished.
+        """
+        done, _ = wait(run.running, return_when=FIRST_COMPLETED)
+        for future in done:
+            name, fingerprint = run.running.pop(future)
+            try:
+                seconds = future.result()
+            except Exception:
+                logger.exception('%s: failed', name)
+                run.status[name] = 'failed'
+                run.state['stages'].pop(name, None)
+                continue
+            run.status[name] = 'ran'
+            run.timings[name] = seconds
+            run.state['stages'][name] = {
+                'fingerprint': fingerprint,
+                'seconds': round(seconds, 3),
+                'finished_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            }
+            logger.info('%s: done in %.1fs', name, seconds)
+            # Persist after every stage so an interrupted run keeps the
+            # work that finished.
+            run.state['files'] = run.digests.entries
+            self._save_state(run.state)
+
+    def run(self, targets=None, force=()):
+        """ Runs the selected stages and returns {stage: status}, where
+            status is 'ran', 'skipped', 'failed' or 'blocked'.
+        """
+        names = self.selected(targets)
+        state = self._load_state()
+        run = _Run(names, state, FileDigests(state.get('files')), force)
+        self.timings = run.timings
+        remaining = list(names)
+
+        with ThreadPoolExecutor(self.workers) as pool:
+            run.pool = pool
+            while remaining or run.running:
+                progressed = self._submit_ready(remaining, run)
+                if run.running:
+                    self._collect_finished(run)
+                elif not progressed:
+                    raise ValueError('dependency cycle among {}'.format(
+                        ', '.join(remaining)))
+
+        state['files'] = run.digests.entries
+        state['last_run'] = {
+            'finished_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'status': run.status,
+            'seconds': {name: round(s, 3)
+                        for name, s in run.timings.items()},
+        }
+        self._save_state(state)
+
+        failed = [name for name, result in run.status.items()
+                  if result in ('failed', 'blocked')]
+        if failed:
+            raise StageFailed('stages did not complete: {}'.format(
+                ', '.join(failed)))
+        return run.status
+
+
+class _Run:
+    """ Bookkeeping for one Pipeline.run call. """
+
+    def __init__(self, names, state, digests, force=()):
+        self.names = names
+        self.state = state
+        self.digests = digests
+        self.force = set(force)
+        self.status = {}
+        self.timings = {}
+        self.running = {}
+        self.pool = None
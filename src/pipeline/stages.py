@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+""" The project's processing stages, from the raw scrape to the artefacts
+    the dashboard and reports read.
+
+    The raw scrape is cleaned in three stages ported from the notebooks
+    (src/data/make_dataset.py): impute and clean write to data/interim,
+    and preprocess writes df.csv. Everything downstream starts from df.csv.
+    Editing an input re-runs the stages that read it, while changing one
+    stage's code re-runs only that stage and its dependents.
+"""
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+
+import click
+import pandas as pd
+
+from src.data import (corrections, make_dataset, price_history,
+                      shared_dataset, validate)
+from src.features import moments
+from src.pipeline.runner import Pipeline, Stage, StageFailed
+from src.visualization import export, visualize
+
+PROJECT_DIR = Path(__file__).resolve().parents[2]
+STATE_PATH = PROJECT_DIR / 'data' / 'interim' / 'pipeline_state.json'
+RAW = 'data/raw/laptops_data.csv'
+IMPUTED = 'data/interim/laptops_imputed.csv'
+CLEANED = 'data/interim/laptops_clean.csv'
+FIXES = 'data/external/listing_fixes.csv'
+DATASET = 'df.csv'
+
+logger = logging.getLogger(__name__)
+
+
+def _write_csv(df, target):
+    path = PROJECT_DIR / target
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(path, index=False)
+
+
+def impute_raw(source, target):
+    _write_csv(make_dataset.impute(pd.read_csv(PROJECT_DIR / source)), target)
+
+
+def clean_listings(source, fixes, target):
+    df = make_dataset.clean(pd.read_csv(PROJECT_DIR / source),
+                            make_dataset.load_fixes(PROJECT_DIR / fixes))
+    _write_csv(df, target)
+
+
+def preprocess_listings(source, target):
+    _write_csv(make_dataset.preprocess(pd.read_csv(PROJECT_DIR / source)),
+               target)
+
+
+def validate_dataset(source, report):
+    result = validate.validate(PROJECT_DIR / source)
+    path = PROJECT_DIR / report
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(result.to_json())
+    logger.info('validation:\n%s', result)
+    if not result.ok:
+        raise ValueError('{} rule violations in {}'.format(
+            result.errors, source))
+
+
+def build_moments(source, state):
+    # Only the rows appended since the last run are folded into the saved
+    # sums. Edits to rows before the last ingest boundary are not detected;
+    # `make moments` rebuilds from scratch.
+    df = pd.read_csv(PROJECT_DIR / source,
+                     usecols=moments.NUMERIC_COLUMNS + ['Brand'])
+    path = PROJECT_DIR / state
+    store = moments.catch_up(moments.MomentStore.load(path), df)
+    store.save(path)
+
+
+def snapshot_prices(source, root):
+    # Labelled with the run date. The stage also re-runs when forced or when
+    # its code changes, so skip prices the latest snapshot already holds
+    # rather than recording them again under a new date.
+    df = pd.read_csv(PROJECT_DIR / source, usecols=price_history.COLUMNS)
+    root = PROJECT_DIR / root
+    latest = price_history.latest_snapshot_of(df, root)
+    if latest is not None:
+        logger.info('prices unchanged since snapshot %s', latest)
+        return
+    price_history.append_snapshot(df, time.strftime('%Y-%m-%d'), root=root,
+                                  overwrite=True)
+
+
+def export_figures(source, output_dir):
+    export.export(PROJECT_DIR / source, PROJECT_DIR / output_dir)
+
+
+def refresh_dashboard(source, target):
+    shutil.copyfile(PROJECT_DIR / source, PROJECT_DIR / target)
+    # Dashboards attached to a shared store pick the new version up too.
+    if os.environ.get(shared_dataset.STORE_ENV_VAR):
+        shared_dataset.publish(pd.read_csv(PROJECT_DIR / source))
+
+
+STAGES = [
+    Stage('impute', impute_raw,
+          inputs=[RAW], outputs=[IMPUTED], code=[make_dataset, corrections],
+          params={'source': RAW, 'target': IMPUTED}),
+    Stage('clean', clean_listings,
+          inputs=[IMPUTED, FIXES], outputs=[CLEANED], deps=['impute'],
+          code=[make_dataset, corrections],
+          params={'source': IMPUTED, 'fixes': FIXES, 'target': CLEANED}),
+    Stage('preprocess', preprocess_listings,
+          inputs=[CLEANED], outputs=[DATASET], deps=['clean'],
+          code=[make_dataset],
+          params={'source': CLEANED, 'target': DATASET}),
+    Stage('validate', validate_dataset,
+          inputs=[DATASET], outputs=['data/interim/validation.json'],
+          deps=['preprocess'], code=[validate],
+          params={'source': DATASET,
+                  'report': 'data/interim/validation.json'}),
+    Stage('features', build_moments,
+          inputs=[DATASET], outputs=['data/processed/moments.npz'],
+          deps=['validate'], code=[moments],
+          params={'source': DATASET, 'state': 'data/processed/moments.npz'}),
+    Stage('price_history', snapshot_prices,
+          inputs=[DATASET], outputs=['data/processed/price_history'],
+          deps=['validate'], code=[price_history],
+          params={'source': DATASET,
+                  'root': 'data/processed/price_history'}),
+    Stage('figures', export_figures,
+          inputs=[DATASET], outputs=['reports/figures/.manifest.json'],
+          deps=['validate'], code=[export, visualize],
+          params={'source': DATASET, 'output_dir': 'reports/figures'}),
+    Stage('dashboard', refresh_dashboard,
+          inputs=[DATASET], outputs=['app_analyis/df.csv'],
+          deps=['validate'], code=[shared_dataset],
+          params={'source': DATASET, 'target': 'app_analyis/df.csv'}),
+]
+
+
+def pipeline(workers=4):
+    return Pipeline(STAGES, PROJECT_DIR, STATE_PATH, workers=workers)
+
+
+@click.command()
+@click.argument('targets', nargs=-1)
+@click.option('--force', multiple=True,
+              help='Re-run this stage even if it is up to date.')
+@click.option('--workers', default=4, show_default=True,
+              help='Stages run in parallel when independent.')
+@click.option('--list', 'list_stages', is_flag=True,
+              help='Show each stage and its last recorded run.')
+def main(targets, force, workers, list_stages):
+    """ Runs the processing pipeline, skipping stages whose code and inputs
+        are unchanged. TARGETS limits the run to those stages and their
+        dependencies.
+    """
+    runner = pipeline(workers)
+    if list_stages:
+        recorded = runner.history()
+        for stage in STAGES:
+            record = recorded.get(stage.name, {})
+            click.echo('{:<14} deps: {:<10} last run: {} ({}s)'.format(
+                stage.name, ','.join(stage.deps) or '-',
+                record.get('finished_at', 'never'),
+                record.get('seconds', '-')))
+        return
+    try:
+        status = runner.run(targets, force=set(force))
+    except StageFailed as exc:
+        raise click.ClickException(str(exc))
+    for name, result in status.items():
+        seconds = runner.timings.get(name)
+        click.echo('{:<14} {:<8} {}'.format(
+            name, result, '{:.1f}s'.format(seconds) if seconds else ''))
+
+
+if __name__ == '__main__':
+    log_fmt = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    logging.basicConfig(level=logging.INFO, format=log_fmt)
+
+    main()
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import inspect
+import json
+import logging
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+from pathlib import Path
+
+import click
+import pandas as pd
+
+from src.data.shared_dataset import dataset_version
+from src.visualization import visualize
+from src.visualization.visualize import BRAND_CHARTS, CHARTS
+
+PROJECT_DIR = Path(__file__).resolve().parents[2]
+FIGURES_DIR = PROJECT_DIR / 'reports' / 'figures'
+MANIFEST_NAME = '.manifest.json'
+FORMATS = ('html', 'png', 'svg')
+
+logger = logging.getLogger(__name__)
+
+# Dataset loaded once per worker process by _init_worker.
+_df = None
+
+
+def _code_version():
+    # The whole module, not just each builder: the builders share helpers
+    # such as _dark() whose edits change every figure.
+    return hashlib.sha256(
+        inspect.getsource(visualize).encode('utf-8')).hexdigest()[:16]
+
+
+def _slug(text):
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', str(text)).strip('_') or 'unknown'
+
+
+def plan(df, formats=FORMATS, brands=True):
+    """ Lists every figure to render as (key, chart, brand, fingerprint).
+        The fingerprint covers the rows the chart reads, the source of the
+        visualize module and the output formats.
+    """
+    code = _code_version()
+    version = dataset_version(df)
+    tasks = []
+    for name in CHARTS:
+        fingerprint = '{}:{}:{}'.format(version, code, ','.join(formats))
+        tasks.append((name, name, None, fingerprint))
+    if brands:
+        for brand, brand_data in df.groupby('Brand', sort=True):
+            brand_version = dataset_version(brand_data)
+            for name in BRAND_CHARTS:
+                key = 'brands/{}/{}'.format(_slug(brand), name)
+                fingerprint = '{}:{}:{}'.format(brand_version, code,
+                                                ','.join(formats))
+                tasks.append((key, name, brand, fingerprint))
+    return tasks
+
+
+def _is_current(manifest, output_dir, key, fingerprint, formats):
+    """ Whether the last export rendered this fingerprint and its files
+        are all still on disk.
+    """
+    if manifest.get(key) != fingerprint:
+        return False
+    base = Path(output_dir) / key
+    return all(base.with_suffix('.' + fmt).exists() for fmt in formats)
+
+
+def _init_worker(input_filepath):
+    global _df
+    _df = pd.read_csv(input_filepath)
+
+
+def _render(key, chart, brand, output_dir, formats):
+    if brand is None:
+        fig = CHARTS[chart](_df)
+    else:
+        brand_data = _df[_df['Brand'] == brand].sort_values(by='Price')
+        fig = BRAND_CHARTS[chart](brand_data, brand)
+
+    base = Path(output_dir) / key
+    base.parent.mkdir(parents=True, exist_ok=True)
+    for fmt in formats:
+        path = base.with_suffix('.' + fmt)
+        if fmt == 'html':
+            fig.write_html(str(path), include_plotlyjs='cdn')
+        else:
+            fig.write_image(str(path), format=fmt)
+    return key
+
+
+def _load_manifest(output_dir):
+    try:
+        with open(Path(output_dir) / MANIFEST_NAME) as fh:
+            return json.load(fh)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _save_manifest(output_dir, manifest):
+    path = Path(output_dir) / MANIFEST_NAME
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w') as fh:
+        json.dump(manifest, fh, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def export(input_filepath, output_dir=FIGURES_DIR, formats=FORMATS,
+           brands=True, workers=None, force=False):
+    """ Renders the dashboard charts to static files under `output_dir`,
+        skipping figures whose fingerprint matches the last export and
+        whose files are still there. Returns
+        (rendered, skipped) counts.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    df = pd.read_csv(input_filepath)
+    manifest = {} if force else _load_manifest(output_dir)
+
+    planned = plan(df, formats, brands)
+    tasks = [task for task in planned
+             if not _is_current(manifest, output_dir, task[0], task[3],
+                                formats)]
+    skipped = len(planned) - len(tasks)
+    if not tasks:
+        return 0, skipped
+
+    fingerprints = {key: fingerprint for key, _, _, fingerprint in tasks}
+    # Spawned, not forked: export runs inside the pipeline's worker
+    # threads, and forking a threaded process can deadlock the children.
+    with ProcessPoolExecutor(workers, mp_context=get_context('spawn'),
+                             initializer=_init_worker,
+                             initargs=(str(input_filepath),)) as pool:
+        futures = [pool.submit(_render, key, chart, brand, str(output_dir),
+                               formats)
+                   for key, chart, brand, _ in tasks]
+        try:
+            for future in as_completed(futures):
+                key = future.result()
+                manifest[key] = fingerprints[key]
+                logger.debug('rendered %s', key)
+        finally:
+            # Keep whatever finished so a failed run resumes where it stopped.
+            _save_manifest(output_dir, manifest)
+    return len(tasks), skipped
+
+
+@click.command()
+@click.argument('input_filepath', type=click.Path(exists=True),
+                default=str(PROJECT_DIR / 'df.csv'))
+@click.argument('output_dir', type=click.Path(file_okay=False),
+                default=str(FIGURES_DIR))
+@click.option('--format', 'formats', multiple=True, default=FORMATS,
+              type=click.Choice(FORMATS), show_default=True)
+@click.option('--no-brands', is_flag=True,
+              help='Skip the per-brand figure sets.')
+@click.option('--workers', type=int, default=None,
+              help='Rendering processes (defaults to the CPU count).')
+@click.option('--force', is_flag=True,
+              help='Re-render everything, ignoring the manifest.')
+def main(input_filepath, output_dir, formats, no_brands, workers, force):
+    """ Renders every dashboard chart, plus a set per Brand, to
+        reports/figures.
+    """
+    start = time.perf_counter()
+    rendered, skipped = export(input_filepath, output_dir, formats=formats,
+                               brands=not no_brands, workers=workers,
+                               force=force)
+    logger.info('rendered %d figures, %d unchanged, in %.1fs', rendered,
+                skipped, time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    log_fmt = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    logging.basicConfig(level=logging.INFO, format=log_fmt)
+
+    main()
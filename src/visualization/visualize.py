@@ -0,0 +1,335 @@
+# -*- coding: utf-8 -*-
+""" Plotly figures shown on the dashboard pages.
+
+    Every builder takes the processed dataset and returns a figure, so the
+    Streamlit app and the static report export render the same charts.
+"""
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+
+def _dark(fig):
+    fig.update_layout(
+        plot_bgcolor="rgba(0, 0, 0, 0)",
+        paper_bgcolor="rgba(0, 0, 0, 0)",
+        font=dict(color="white")
+    )
+    return fig
+
+
+# Home
+
+def price_by_brand(df):
+    fig = px.box(df, x="Brand", y="Price", title="Price Distribution by Brand",
+                 labels={"Price": "Price in Rupees", "Brand": "Laptop Brand"})
+    return _dark(fig)
+
+
+def top_5_by_price(df):
+    top_5_df = df[['Brand', 'Spec_Score', 'Series', 'Price']].sort_values(
+        by='Price', ascending=False).head()
+    fig = go.Figure(data=[go.Table(
+        columnwidth=[80, 80, 80, 80],
+        header=dict(values=list(top_5_df.columns),
+                    fill_color='gray',
+                    font=dict(color='white', size=12),
+                    align='center'),
+        cells=dict(values=[top_5_df.Brand, top_5_df.Spec_Score,
+                           top_5_df.Series, top_5_df.Price],
+                   fill_color='lightgray',
+                   font=dict(color='black', size=11),
+                   align='center'))
+    ])
+    fig.update_layout(
+        width=800,
+        height=200,
+        margin=dict(l=0, r=0, t=0, b=0),
+        paper_bgcolor="#1E1E1E",
+        plot_bgcolor="#1E1E1E"
+    )
+    return fig
+
+
+def average_price_by_brand(df):
+    avg_price_by_brand = df.groupby('Brand')['Price'].mean().reset_index()
+    fig = px.bar(avg_price_by_brand, x='Brand', y='Price', color='Brand',
+                 title="Average Price by Brand",
+                 labels={"Price": "Average Price in Rupees",
+                         "Brand": "Laptop Brand"})
+    return _dark(fig)
+
+
+# Data Overview
+
+def _brand_counts(df):
+    brand_counts = df['Brand'].value_counts().reset_index()
+    brand_counts.columns = ['Brand', 'Count']
+    return brand_counts
+
+
+def brand_distribution(df):
+    fig = px.bar(_brand_counts(df), x='Brand', y='Count',
+                 title="Number of Laptops per Brand",
+                 labels={"Brand": "Brand", "Count": "Count"})
+    return _dark(fig)
+
+
+def brand_market_share(df):
+    brand_counts = _brand_counts(df)
+    top_5_brands = brand_counts.nlargest(5, 'Count')
+    other_brands = brand_counts.iloc[5:]
+
+    fig = make_subplots(rows=1, cols=2,
+                        specs=[[{'type': 'domain'}, {'type': 'domain'}]],
+                        subplot_titles=('Top 5 Brands', 'Other Brands'))
+    fig.add_trace(go.Pie(labels=top_5_brands['Brand'],
+                         values=top_5_brands['Count'], name="Top 5 Brands"),
+                  row=1, col=1)
+    fig.add_trace(go.Pie(labels=other_brands['Brand'],
+                         values=other_brands['Count'], name="Other Brands"),
+                  row=1, col=2)
+    fig.update_layout(
+        title_text="Market Share of Laptop Brands",
+        annotations=[dict(text='Top 5 Brands', x=0.18, y=0.5, font_size=15,
+                          showarrow=False),
+                     dict(text='Other Brands', x=0.82, y=0.5, font_size=15,
+                          showarrow=False)],
+    )
+    return _dark(fig)
+
+
+# Brand Analysis (one brand's rows)
+
+def brand_spec_score_distribution(brand_data, brand):
+    fig = px.box(brand_data, y='Spec_Score', color='Brand',
+                 title=f"Spec Score Distribution for {brand}",
+                 labels={"Spec_Score": "Specification Score",
+                         "Brand": "Laptop Brand"})
+    return _dark(fig)
+
+
+def brand_price_vs_spec_score(brand_data, brand):
+    fig = px.scatter(brand_data, x='Spec_Score', y='Price', color='Series',
+                     title=f"Price vs. Spec Score for {brand}",
+                     labels={"Spec_Score": "Specification Score",
+                             "Price": "Price in Rupees",
+                             "Series": "Laptop Series"})
+    return _dark(fig)
+
+
+# Price Analysis
+
+def price_distribution(df):
+    fig = px.histogram(df, x='Price', nbins=30, color='Brand',
+                       title="Distribution of Laptop Prices",
+                       labels={"Price": "Price in USD",
+                               "Brand": "Laptop Brand"})
+    return _dark(fig)
+
+
+def price_vs_spec_score(df):
+    fig = px.scatter(df, x="Spec_Score", y="Price", color="Brand",
+                     title="Price vs. Spec Score",
+                     labels={"Spec_Score": "Specification Score",
+                             "Price": "Price in Rupees",
+                             "Brand": "Laptop Brand"})
+    return _dark(fig)
+
+
+def price_range_distribution(df):
+    price_range_counts = df['Price_Range'].value_counts().reset_index()
+    price_range_counts.columns = ['Price_Range', 'Count']
+    fig = px.bar(price_range_counts, x='Price_Range', y='Count',
+                 title="Number of Laptops per Price Range",
+                 labels={"Price_Range": "Price Range", "Count": "Count"})
+    return _dark(fig)
+
+
+def top_10_expensive(df):
+    fig = px.bar(df.nlargest(10, 'Price'), x='Series', y='Price',
+                 color='Brand', title="Top 10 Most Expensive Laptops",
+                 labels={"Series": "Laptop Series",
+                         "Price": "Price in Rupees",
+                         "Brand": "Laptop Brand"})
+    return _dark(fig)
+
+
+def price_by_utility(df):
+    fig = px.box(df, x='Utility', y='Price', color='Utility',
+                 title="Price Distribution by Utility",
+                 labels={"Utility": "Utility", "Price": "Price in Rupees"})
+    return _dark(fig)
+
+
+def price_vs_ram(df):
+    fig = px.scatter(df, x='Ram_Capacity(GB)', y='Price', color='Brand',
+                     title="Price vs. RAM Capacity",
+                     labels={"Ram_Capacity(GB)": "RAM Capacity (GB)",
+                             "Price": "Price in Rupees",
+                             "Brand": "Laptop Brand"})
+    return _dark(fig)
+
+
+# Performance Analysis
+
+def spec_score_distribution(df):
+    fig = px.histogram(df, x='Spec_Score', nbins=30, color='Brand',
+                       title="Distribution of Specification Scores",
+                       labels={"Spec_Score": "Specification Score",
+                               "Brand": "Laptop Brand"})
+    return _dark(fig)
+
+
+def top_10_by_spec_score(df):
+    fig = px.bar(df.nlargest(10, 'Spec_Score'), x='Series', y='Spec_Score',
+                 color='Brand',
+                 title="Top 10 Laptops by Specification Score",
+                 labels={"Series": "Laptop Series",
+                         "Spec_Score": "Specification Score",
+                         "Brand": "Laptop Brand"})
+    return _dark(fig)
+
+
+def spec_score_vs_ram(df):
+    fig = px.scatter(df, x='Ram_Capacity(GB)', y='Spec_Score', color='Brand',
+                     title="Specification Score vs. RAM Capacity",
+                     labels={"Ram_Capacity(GB)": "RAM Capacity (GB)",
+                             "Spec_Score": "Specification Score",
+                             "Brand": "Laptop Brand"})
+    return _dark(fig)
+
+
+# Display and Design Analysis
+
+def screen_size_distribution(df):
+    fig = px.histogram(df, x='Display Size (Inches)', nbins=20, color='Brand',
+                       title="Distribution of Screen Sizes",
+                       labels={"Display Size (Inches)": "Screen Size (inches)",
+                               "Brand": "Laptop Brand"})
+    return _dark(fig)
+
+
+def resolution_distribution(df):
+    resolution = (df['Resolution Width'].astype(str) + 'x'
+                  + df['Resolution Height'].astype(str))
+    resolution_counts = resolution.rename('Resolution').value_counts() \
+        .reset_index()
+    resolution_counts.columns = ['Resolution', 'Count']
+    fig = px.bar(resolution_counts, x='Resolution', y='Count',
+                 color='Resolution',
+                 title="Distribution of Screen Resolutions",
+                 labels={"Resolution": "Screen Resolution", "Count": "Count"})
+    return _dark(fig)
+
+
+def ppi_vs_price(df):
+    fig = px.scatter(df, x='PPI', y='Price', color='Brand',
+                     title="PPI vs. Price",
+                     labels={"PPI": "Pixels Per Inch (PPI)",
+                             "Price": "Price in Rupees",
+                             "Brand": "Laptop Brand"})
+    return _dark(fig)
+
+
+# Additional Insights
+
+def os_distribution(df):
+    os_counts = df['OS Type'].value_counts().reset_index()
+    os_counts.columns = ['OS Type', 'Count']
+    fig = px.pie(os_counts, values='Count', names='OS Type',
+                 title="Operating System Distribution")
+    return _dark(fig)
+
+
+def graphics_brand_distribution(df):
+    graphics_counts = df['Graphics_Brand'].value_counts().reset_index()
+    graphics_counts.columns = ['Graphics_Brand', 'Count']
+    fig = px.bar(graphics_counts, x='Graphics_Brand', y='Count',
+                 color='Graphics_Brand', title="Graphics Brand Distribution",
+                 labels={"Graphics_Brand": "Graphics Brand",
+                         "Count": "Count"})
+    return _dark(fig)
+
+
+def weight_vs_price(df):
+    fig = px.scatter(df, x='Weight(kg)', y='Price', color='Brand',
+                     title="Weight vs. Price",
+                     labels={"Weight(kg)": "Weight (kg)",
+                             "Price": "Price in USD",
+                             "Brand": "Laptop Brand"})
+    return _dark(fig)
+
+
+# Price Trends (price history store)
+
+def series_price_trend(trajectory, series):
+    fig = px.line(trajectory, x='snapshot', y='mean_price', markers=True,
+                  title=f"Price Trajectory for {series}",
+                  labels={"snapshot": "Snapshot",
+                          "mean_price": "Average Price in Rupees"})
+    fig.add_scatter(x=trajectory['snapshot'], y=trajectory['min_price'],
+                    mode='lines', line=dict(dash='dot'), name='Min')
+    fig.add_scatter(x=trajectory['snapshot'], y=trajectory['max_price'],
+                    mode='lines', line=dict(dash='dot'), name='Max')
+    return _dark(fig)
+
+
+def brand_price_moves(moves, start, end):
+    fig = px.bar(moves, x='Brand', y='change_pct', color='Brand',
+                 title=f"Average Price Change by Brand, {start} to {end}",
+                 labels={"change_pct": "Change in Average Price (%)",
+                         "Brand": "Laptop Brand"})
+    return _dark(fig)
+
+
+# Correlation Analysis
+
+def correlation_heatmap(corr, title="Correlation Matrix"):
+    fig = px.imshow(corr.round(2), text_auto=True, zmin=-1, zmax=1,
+                    color_continuous_scale='RdBu_r', aspect='auto',
+                    title=title)
+    return _dark(fig)
+
+
+def price_correlation_by_brand(price_corr):
+    fig = px.imshow(price_corr.round(2), text_auto=True, zmin=-1, zmax=1,
+                    color_continuous_scale='RdBu_r', aspect='auto',
+                    title="Correlation with Price by Brand",
+                    labels={"x": "Feature", "y": "Laptop Brand",
+                            "color": "Correlation"})
+    return _dark(fig)
+
+
+# Charts exported to reports/figures, keyed by "<page>/<chart>".
+CHARTS = {
+    'home/price_by_brand': price_by_brand,
+    'home/top_5_by_price': top_5_by_price,
+    'home/average_price_by_brand': average_price_by_brand,
+    'data_overview/brand_distribution': brand_distribution,
+    'data_overview/brand_market_share': brand_market_share,
+    'price_analysis/price_distribution': price_distribution,
+    'price_analysis/price_vs_spec_score': price_vs_spec_score,
+    'price_analysis/price_range_distribution': price_range_distribution,
+    'price_analysis/top_10_expensive': top_10_expensive,
+    'price_analysis/price_by_utility': price_by_utility,
+    'price_analysis/price_vs_ram': price_vs_ram,
+    'performance_analysis/spec_score_distribution': spec_score_distribution,
+    'performance_analysis/top_10_by_spec_score': top_10_by_spec_score,
+    'performance_analysis/spec_score_vs_ram': spec_score_vs_ram,
+    'display_design_analysis/screen_size_distribution':
+        screen_size_distribution,
+    'display_design_analysis/resolution_distribution':
+        resolution_distribution,
+    'display_design_analysis/ppi_vs_price': ppi_vs_price,
+    'additional_insights/os_distribution': os_distribution,
+    'additional_insights/graphics_brand_distribution':
+        graphics_brand_distribution,
+    'additional_insights/weight_vs_price': weight_vs_price,
+}
+
+# Charts rendered once per Brand from that brand's rows.
+BRAND_CHARTS = {
+    'spec_score_distribution': brand_spec_score_distribution,
+    'price_vs_spec_score': brand_price_vs_spec_score,
+}
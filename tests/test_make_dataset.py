@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+""" Runs the cleaning steps over the head of the raw scrape. """
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+pytest.importorskip('sklearn')
+
+from src.data.make_dataset import clean, impute, preprocess  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[1]
+ROWS = 60
+
+
+@pytest.fixture(scope='module')
+def raw():
+    return pd.read_csv(ROOT / 'data' / 'raw' / 'laptops_data.csv', nrows=ROWS)
+
+
+@pytest.fixture(scope='module')
+def imputed(raw):
+    return impute(raw)
+
+
+def _fixes(*rows):
+    return pd.DataFrame(rows, columns=['Name', 'Column', 'Value'])
+
+
+def test_impute_fills_every_clock_speed(raw, imputed):
+    assert raw['Clock-speed'].isna().any()
+    assert imputed['Clock-speed'].notna().all()
+    assert imputed['Price'].iloc[0] == 34990
+    assert imputed['Price_Range'].iloc[0] == 'Medium-Low'
+    assert imputed[['Processor_Brand', 'Series']].iloc[0].tolist() == [
+        'Intel', 'Core i5']
+
+
+def test_processed_columns_match_the_dataset(imputed):
+    df = preprocess(clean(imputed, _fixes()))
+    committed = pd.read_csv(ROOT / 'df.csv', nrows=ROWS)
+
+    assert list(df.columns) == list(committed.columns)
+    for column in ['Price', 'Price_Range', 'Original_Brand', 'Model_Name',
+                   'Ram_Capacity(GB)', 'Weight(kg)', 'PPI', 'OS Type']:
+        assert df[column].tolist() == committed[column].tolist(), column
+
+
+def test_fixes_only_fill_gaps(imputed):
+    listings = imputed.copy()
+    gap, filled = listings['Name'].iloc[:2]
+    listings.loc[0, 'Touchscreen'] = None
+    listings.loc[1, 'Touchscreen'] = 'No'
+    df = clean(listings, _fixes((gap, 'Touchscreen', 'Yes'),
+                                (filled, 'Touchscreen', 'Yes')))
+
+    assert df['Touchscreen'].iloc[:2].tolist() == ['Yes', 'No']
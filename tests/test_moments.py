@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+""" Checks the running moment sums against pandas. """
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.moments import MomentStore, MomentSums, catch_up
+
+COLUMNS = ['Price', 'Spec_Score', 'PPI']
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(200, 3)), columns=COLUMNS)
+    df['Spec_Score'] += df['Price'] * 0.5
+    # Scattered gaps exercise the pairwise-complete counts.
+    df = df.mask(rng.random(df.shape) < 0.1)
+    df['Brand'] = rng.choice(['Acer', 'Asus', 'HP'], size=len(df))
+    return df
+
+
+def _store(df, **kwargs):
+    return MomentStore.from_frame(df, columns=COLUMNS, **kwargs)
+
+
+def test_correlation_matches_pandas_with_missing_values(frame):
+    moments = MomentSums(COLUMNS).update(frame)
+    pd.testing.assert_frame_equal(moments.correlation(),
+                                  frame[COLUMNS].corr())
+
+
+def test_update_in_chunks_equals_merge_of_parts(frame):
+    chunked = MomentSums(COLUMNS)
+    for start in range(0, len(frame), 37):
+        chunked.update(frame.iloc[start:start + 37])
+    merged = MomentSums(COLUMNS).update(frame.iloc[:120]).merge(
+        MomentSums(COLUMNS).update(frame.iloc[120:]))
+    whole = MomentSums(COLUMNS).update(frame)
+    for moments in (chunked, merged):
+        for name in ('n', 'sx', 'sxx', 'sxy'):
+            np.testing.assert_allclose(getattr(moments, name),
+                                       getattr(whole, name))
+
+
+def test_group_correlation_matches_pandas(frame):
+    store = _store(frame, chunksize=50)
+    asus = frame[frame['Brand'] == 'Asus']
+    pd.testing.assert_frame_equal(store.correlation('Asus'),
+                                  asus[COLUMNS].corr())
+
+
+def test_catch_up_ingests_only_appended_rows(frame, tmp_path):
+    path = tmp_path / 'moments.npz'
+    _store(frame.iloc[:150]).save(path)
+    saved = MomentStore.load(path)
+
+    caught_up = catch_up(saved, frame, version='v2')
+    assert caught_up is saved
+    assert caught_up.rows == len(frame)
+    assert caught_up.version == 'v2'
+    pd.testing.assert_frame_equal(caught_up.correlation(),
+                                  frame[COLUMNS].corr())
+
+
+def test_catch_up_rebuilds_when_rows_changed(frame):
+    store = _store(frame.iloc[:150])
+    reordered = frame.iloc[::-1].reset_index(drop=True)
+
+    caught_up = catch_up(store, reordered)
+    assert caught_up is not store
+    assert caught_up.rows == len(frame)
+    pd.testing.assert_frame_equal(caught_up.correlation(),
+                                  frame[COLUMNS].corr())
+
+
+def test_catch_up_keeps_store_for_known_version(frame):
+    store = _store(frame, version='v1')
+    assert catch_up(store, frame.iloc[:10], version='v1') is store
+
+
+def test_ingest_without_version_clears_it(frame):
+    store = _store(frame.iloc[:100], version='v1')
+    store.ingest(frame.iloc[100:])
+    assert store.version is None
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+""" Runs the memoized pipeline runner over throwaway stages. """
+import json
+
+import pytest
+
+from src.pipeline.runner import Pipeline, Stage, StageFailed
+
+
+def copy_text(root, source, target):
+    (root / target).write_text((root / source).read_text().upper())
+
+
+def fail(root):
+    raise RuntimeError('boom')
+
+
+@pytest.fixture
+def root(tmp_path):
+    (tmp_path / 'raw.txt').write_text('laptops')
+    return tmp_path
+
+
+def _pipeline(root, extra=()):
+    stages = [
+        Stage('clean', copy_text, inputs=['raw.txt'], outputs=['clean.txt'],
+              params={'root': root, 'source': 'raw.txt',
+                      'target': 'clean.txt'}),
+        Stage('report', copy_text, inputs=['clean.txt'],
+              outputs=['report.txt'], deps=['clean'],
+              params={'root': root, 'source': 'clean.txt',
+                      'target': 'report.txt'}),
+    ] + list(extra)
+    return Pipeline(stages, root, root / 'state.json', workers=2)
+
+
+def test_runs_in_order_then_skips_fresh_stages(root):
+    assert _pipeline(root).run() == {'clean': 'ran', 'report': 'ran'}
+    assert (root / 'report.txt').read_text() == 'LAPTOPS'
+
+    pipeline = _pipeline(root)
+    assert pipeline.run() == {'clean': 'skipped', 'report': 'skipped'}
+    assert pipeline.timings == {}
+
+
+def test_changed_input_reruns_dependents_only_if_output_changes(root):
+    _pipeline(root).run()
+    (root / 'raw.txt').write_text('Laptops')
+    # clean re-runs but writes the same text, so report stays fresh.
+    assert _pipeline(root).run() == {'clean': 'ran', 'report': 'skipped'}
+
+
+def test_missing_output_and_force_rerun(root):
+    _pipeline(root).run()
+    (root / 'report.txt').unlink()
+    assert _pipeline(root).run() == {'clean': 'skipped', 'report': 'ran'}
+    assert _pipeline(root).run(force={'clean'}) == {'clean': 'ran',
+                                                    'report': 'skipped'}
+
+
+def test_targets_select_dependencies(root):
+    assert _pipeline(root).run(['clean']) == {'clean': 'ran'}
+
+
+def test_failure_blocks_dependents_and_is_not_recorded(root):
+    broken = Stage('broken', fail, deps=['clean'], params={'root': root})
+    after = Stage('after', copy_text, deps=['broken'],
+                  params={'root': root, 'source': 'raw.txt',
+                          'target': 'after.txt'})
+    pipeline = _pipeline(root, [broken, after])
+
+    with pytest.raises(StageFailed, match='broken, after'):
+        pipeline.run()
+    state = json.loads((root / 'state.json').read_text())
+    assert state['last_run']['status'] == {
+        'clean': 'ran', 'report': 'ran', 'broken': 'failed',
+        'after': 'blocked'}
+    assert set(state['stages']) == {'clean', 'report'}
+    assert set(state['last_run']['seconds']) == {'clean', 'report'}
+    assert not (root / 'after.txt').exists()
+
+
+def test_missing_input_fails_the_stage(root):
+    (root / 'raw.txt').unlink()
+    with pytest.raises(StageFailed, match='clean, report'):
+        _pipeline(root).run()
+
+
+def test_cycle_is_detected(root):
+    stages = [Stage('a', fail, deps=['b'], params={'root': root}),
+              Stage('b', fail, deps=['a'], params={'root': root})]
+    with pytest.raises(ValueError, match='dependency cycle'):
+        Pipeline(stages, root, root / 'state.json').run()
+
+
+def test_unknown_dependency_is_rejected(root):
+    with pytest.raises(ValueError, match='unknown missing'):
+        Pipeline([Stage('a', fail, deps=['missing'])], root,
+                 root / 'state.json')
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+""" Runs the scraper end to end against the fixture stand-in. """
+import asyncio
+import csv
+import socket
+
+import pytest
+
+pytest.importorskip('aiohttp')
+pytest.importorskip('bs4')
+
+from src.data.scraper.scrape import scrape  # noqa: E402
+from src.data.scraper.standin import ORIGIN, fixture_path, serve  # noqa: E402
+
+LISTING = ORIGIN + '/laptopfinder.php?page={page}'
+PAGES = {
+    1: [('alpha', 'Alpha 14', '49,990', '71%'),
+        ('beta', 'Beta 15', '62,490', '78%')],
+    2: [('gamma', 'Gamma 16', '84,990', '83%')],
+}
+
+
+def _card(slug, name, price, score):
+    return ('<div class="finder_snipet_wrap">'
+            '<a class="hover_blue_link" href="{}/laptop-{}">{}</a>'
+            '<span class="price">Rs. {}</span>'
+            '<div class="rating_box_new_list">{}</div>'
+            '</div>').format(ORIGIN, slug, name, price, score)
+
+
+def _detail(name):
+    return ('<html><body><span class="ratpt">4.2/5</span><table>'
+            '<tr><td>Processor</td><td>{} CPU</td></tr>'
+            '<tr><td>Weight</td><td>1.5 kg</td></tr>'
+            '</table></body></html>').format(name)
+
+
+def _write(directory, url, html):
+    fixture_path(directory, url).write_text(html, encoding='utf-8')
+
+
+@pytest.fixture
+def site(tmp_path):
+    """ Two listing pages and their detail pages; page 3 is a 404. """
+    fixtures = tmp_path / 'fixtures'
+    fixtures.mkdir()
+    for page, cards in PAGES.items():
+        _write(fixtures, LISTING.format(page=page),
+               '<html><body>{}</body></html>'.format(
+                   ''.join(_card(*card) for card in cards)))
+        for slug, name, _, _ in cards:
+            _write(fixtures, '{}/laptop-{}'.format(ORIGIN, slug),
+                   _detail(name))
+    server = serve(fixtures)
+    yield 'http://127.0.0.1:{}'.format(server.server_port)
+    server.shutdown()
+    server.server_close()
+
+
+def _run(output, base, listing='/laptopfinder.php?page={page}', **kwargs):
+    return asyncio.run(asyncio.wait_for(scrape(
+        output, listing_url=base + listing, concurrency=2, rate=100,
+        retries=0, workers=1, **kwargs), timeout=60))
+
+
+def _rows(path):
+    with open(path, newline='') as fh:
+        return list(csv.DictReader(fh))
+
+
+def test_scrape_reads_every_page_until_404(site, tmp_path):
+    output = tmp_path / 'laptops.csv'
+    assert _run(output, site) == 3
+
+    rows = sorted(_rows(output), key=lambda row: row['Name'])
+    assert [row['Name'] for row in rows] == ['Alpha 14', 'Beta 15',
+                                             'Gamma 16']
+    assert rows[0]['Price'] == '49,990'
+    assert rows[0]['Spec Score'] == '71'
+    assert rows[0]['Processor'] == 'Alpha 14 CPU'
+    assert rows[0]['Overall Rating'] == '4.2'
+    assert rows[0]['SSD Capacity'] == 'N/A'
+    assert not (tmp_path / 'laptops.csv.checkpoint').exists()
+
+
+def test_scrape_resumes_from_checkpoint(site, tmp_path):
+    output = tmp_path / 'laptops.csv'
+    assert _run(output, site) == 3
+    kept = [row for row in _rows(output) if row['Name'] == 'Beta 15']
+    with open(output, 'w', newline='') as fh:
+        writer = csv.DictWriter(fh, fieldnames=list(kept[0]))
+        writer.writeheader()
+        writer.writerows(kept)
+    checkpoint = tmp_path / 'laptops.csv.checkpoint'
+    checkpoint.write_text(site + '/laptop-beta\n')
+
+    assert _run(output, site) == 2
+    assert sorted(row['Name'] for row in _rows(output)) == [
+        'Alpha 14', 'Beta 15', 'Gamma 16']
+    assert not checkpoint.exists()
+
+
+def test_scrape_stops_when_listing_pages_keep_failing(tmp_path):
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    output = tmp_path / 'laptops.csv'
+
+    assert _run(output, 'http://127.0.0.1:{}'.format(port)) == 0
+    assert (tmp_path / 'laptops.csv.checkpoint').exists()
+
+
+def test_scrape_stops_when_pages_repeat(site, tmp_path):
+    output = tmp_path / 'laptops.csv'
+    _write(tmp_path / 'fixtures', ORIGIN + '/laptopfinder.php',
+           fixture_path(tmp_path / 'fixtures',
+                        LISTING.format(page=1)).read_text())
+
+    # Without a {page} placeholder every page number gets page 1 again,
+    # like a site that ignores the parameter.
+    assert _run(output, site, listing='/laptopfinder.php') == 2
+    names = sorted(row['Name'] for row in _rows(output))
+    assert names == ['Alpha 14', 'Beta 15']
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+""" Runs the validation rules over a small frame with known violations. """
+import json
+
+import pandas as pd
+import pytest
+
+from src.data.validate import (AllowedValues, InRange, PpiConsistent,
+                               Unique, validate)
+
+RULES = [
+    AllowedValues('Brand', ['Acer', 'HP']),
+    InRange('Price', 5000, 100000),
+    PpiConsistent(),
+    Unique('Model_Name', severity='warning'),
+]
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({
+        'Brand': ['Acer', 'HP', 'Dell', 'Acer', 'HP', 'Acer'],
+        'Price': [45000, 2000, 60000, None, 99000, 70000],
+        'Model_Name': ['A1', 'H1', 'D1', 'A1', 'H2', 'A1'],
+        'Resolution Width': [1920] * 6,
+        'Resolution Height': [1080] * 6,
+        'Display Size (Inches)': [15.6] * 6,
+        'PPI': [141.21, 141.21, 141.21, 141.21, 200.0, 141.21],
+    })
+
+
+def _counts(report):
+    return {entry['rule']: (entry['violations'], entry['sample_rows'])
+            for entry in report.entries}
+
+
+@pytest.mark.parametrize('chunksize,workers', [(100, 1), (2, 1), (2, 2)])
+def test_violations_are_counted_across_chunks(frame, chunksize, workers):
+    report = validate(frame, RULES, chunksize=chunksize, workers=workers)
+
+    assert report.rows == 6
+    assert _counts(report) == {
+        'Brand in allowed values': (1, [2]),
+        'Price in [5000, 100000]': (2, [1, 3]),
+        'PPI consistent with resolution and display size': (1, [4]),
+        'Model_Name is unique': (3, [0, 3, 5]),
+    }
+    # Duplicate model names are only a warning.
+    assert report.errors == 4
+    assert not report.ok
+
+
+def test_sample_rows_are_capped(frame):
+    report = validate(frame, RULES, chunksize=2, sample_size=2)
+    assert _counts(report)['Model_Name is unique'] == (3, [0, 3])
+
+
+def test_clean_frame_passes_and_reports_json(frame):
+    clean = frame.drop(index=[1, 2, 3, 4])
+    report = validate(clean, RULES)
+
+    assert report.ok
+    payload = json.loads(report.to_json())
+    assert payload['rows'] == 2
+    assert [rule['violations'] for rule in payload['rules']] == [0, 0, 0, 2]